@@ -0,0 +1 @@
+"""Synthetic exports and timing harness for the dashboard pipeline."""
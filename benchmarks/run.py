@@ -0,0 +1,259 @@
+"""Time each dashboard section on synthetic exports at several scales.
+
+    python -m benchmarks.run --scale 1 10 100 1000
+    python -m benchmarks.run --scale 100 --compare benchmarks/results/<old>.json
+
+For every section the harness times the stages the dashboard goes through:
+import (the modules the app imports at startup plus those the section
+imports on first use, in a fresh interpreter), load (export parse and
+Parquet write when cold, Parquet read when warm), preprocess
+(``c4s.prepare``), aggregate (``c4s.sections`` on loaded frames) and chart
+spec build (``c4s.charts`` plus ``to_dict``). Timings are the median of
+``--repeat`` runs; peak memory comes from one extra run under
+``tracemalloc``, which sees NumPy and Python allocations but not Arrow's.
+The import stage has neither rows nor a peak.
+Results are written as JSON named after the commit, so runs on two commits
+can be compared with ``--compare``.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import altair as alt
+import pandas as pd
+import pyarrow
+
+from c4s import charts
+from c4s.dataset import Dataset
+from c4s.prepare import LOAD_COLUMNS, PREPARERS
+from c4s.sections import SECTION_SOURCES, SECTIONS
+from c4s.sources import CACHE_DIR, read_source
+
+from .synthetic import VERSION, generate
+
+BENCH_DIR = Path(".cache") / "bench"
+RESULTS_DIR = Path("benchmarks") / "results"
+STAGES = ["import", "load_cold", "load_warm", "preprocess", "aggregate", "chart"]
+
+# What app.py imports before drawing any page
+STARTUP_IMPORTS = [
+    "streamlit",
+    "c4s.charts",
+    "c4s.dataset",
+    "c4s.downsample",
+    "c4s.pages",
+    "c4s.prepare",
+    "c4s.sections",
+    "c4s.specs",
+    "c4s.stream",
+    "c4s.trace",
+    "c4s.wordclouds",
+]
+
+# Modules a section imports the first time it is drawn
+SECTION_IMPORTS = {"facebook": ["matplotlib.figure", "wordcloud"]}
+
+
+def measure(func, repeat, setup=None):
+    """Median and best wall time of ``func(setup())`` and its peak memory."""
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        started = time.perf_counter()
+        func(state)
+        times.append(time.perf_counter() - started)
+    state = setup() if setup else None
+    tracemalloc.start()
+    try:
+        func(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": statistics.median(times), "best": min(times), "peak": peak}
+
+
+def import_seconds(modules):
+    """Seconds a fresh interpreter spends importing ``modules``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: self | cumulative | name", nested imports
+    # indented under the top-level one whose cumulative time includes them
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and not fields[2].startswith("  "):
+            cumulative = fields[1].strip()
+            if cumulative.isdigit():
+                total += int(cumulative)
+    return total / 1e6
+
+
+def measure_imports(modules, repeat):
+    times = [import_seconds(modules) for _ in range(repeat)]
+    return {"seconds": statistics.median(times), "best": min(times), "peak": None}
+
+
+def synthetic_dir(scale, seed=0):
+    """Generated exports for ``scale``, reused across runs and commits."""
+    data_dir = BENCH_DIR / f"scale-{scale}-seed-{seed}"
+    marker = data_dir / "_generated.json"
+    generated = json.loads(marker.read_text()) if marker.exists() else {}
+    if generated.get("version") != VERSION:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        rows = generate(data_dir, scale, seed)
+        generated = {
+            "version": VERSION,
+            "scale": scale,
+            "seed": seed,
+            "rows": rows,
+        }
+        marker.write_text(json.dumps(generated))
+    return data_dir
+
+
+def _rows(frames):
+    return sum(len(frame) for frame in frames.values())
+
+
+def bench_section(data_dir, section, repeat):
+    names = SECTION_SOURCES[section]
+    cache_dir = data_dir / CACHE_DIR
+
+    def clear_cache():
+        for name in names:
+            for suffix in [".parquet", ".json"]:
+                (cache_dir / f"{name}{suffix}").unlink(missing_ok=True)
+
+    def load(_):
+        return {
+            name: read_source(name, data_dir, LOAD_COLUMNS.get(name)) for name in names
+        }
+
+    def loaded_dataset():
+        # Frames loaded and prepared, nothing derived from them yet
+        dataset = Dataset(data_dir)
+        for name in names:
+            dataset.frame(name)
+        return dataset
+
+    results = {
+        "import": measure_imports(
+            STARTUP_IMPORTS + SECTION_IMPORTS.get(section, []), repeat
+        ),
+        "load_cold": measure(load, repeat, clear_cache),
+    }
+    raw = load(None)
+    results["load_warm"] = measure(load, repeat)
+    results["preprocess"] = measure(
+        lambda _: {name: PREPARERS[name](raw[name]) for name in names}, repeat
+    )
+    results["aggregate"] = measure(SECTIONS[section][1], repeat, loaded_dataset)
+    aggregates = SECTIONS[section][1](loaded_dataset())
+    results["chart"] = measure(
+        lambda _: {
+            chart_id: chart.to_dict()
+            for chart_id, chart in charts.build_charts(section, aggregates).items()
+        },
+        repeat,
+    )
+
+    results["import"]["rows"] = None
+    results["load_cold"]["rows"] = results["load_warm"]["rows"] = _rows(raw)
+    results["preprocess"]["rows"] = _rows(raw)
+    results["aggregate"]["rows"] = results["chart"]["rows"] = _rows(aggregates)
+    return results
+
+
+def git_describe():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _key(row):
+    return row["scale"], row["section"], row["stage"]
+
+
+def print_row(row, baseline=None):
+    rows = "" if row["rows"] is None else f"{row['rows']:>10} rows"
+    peak = "" if row["peak"] is None else f"{row['peak'] / 2**20:>9.1f} MiB"
+    line = (
+        f"{row['scale']:>6}x {row['section']:<15} {row['stage']:<11}"
+        f"{rows:>15} {row['seconds'] * 1000:>10.1f} ms{peak:>13}"
+    )
+    if baseline and _key(row) in baseline:
+        line += f"  {row['seconds'] / baseline[_key(row)]['seconds']:>6.2f}x baseline"
+    print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark every section on synthetic exports."
+    )
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--section", dest="sections", action="append", choices=SECTIONS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path)
+    parser.add_argument("--compare", type=Path, help="earlier results file")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        previous = json.loads(args.compare.read_text())
+        baseline = {_key(row): row for row in previous["results"]}
+
+    commit = git_describe()
+    rows = []
+    for scale in args.scale:
+        data_dir = synthetic_dir(scale, args.seed)
+        for section in args.sections or SECTIONS:
+            results = bench_section(data_dir, section, args.repeat)
+            for stage in STAGES:
+                row = {"scale": scale, "section": section, "stage": stage}
+                row.update(results[stage])
+                rows.append(row)
+                print_row(row, baseline)
+
+    out = args.out or RESULTS_DIR / f"{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "pyarrow": pyarrow.__version__,
+                "altair": alt.__version__,
+                "repeat": args.repeat,
+                "seed": args.seed,
+                "results": rows,
+            },
+            indent=1,
+        )
+    )
+    print(f"wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
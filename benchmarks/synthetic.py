@@ -0,0 +1,467 @@
+"""Schema-accurate synthetic platform exports at a multiple of the real size.
+
+    python -m benchmarks.synthetic --scale 100 .cache/bench/scale-100
+
+Each generator writes the same file name, column names and value formats as
+the platform's own export: ``"2025/03/11 2:02 PM"`` send times and ``"48.0%"``
+rate strings in the email CSV, the LinkedIn description row above the real
+header, the competitor date-range row, and so on. ``scale=1`` matches the row
+counts of the exports in the repository. Daily exports grow by covering more
+days, capped at a century; the fixed-size summaries do not grow.
+"""
+
+import argparse
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from c4s.sections import INSTAGRAM_KEYWORDS
+from c4s.sources import SOURCES
+
+# Bumped whenever the same scale and seed generate different data
+VERSION = 2
+
+# Rows in the exports checked into the repository
+BASE_ROWS = {
+    "email_clicks": 7,
+    "facebook": 56,
+    "meta_suite": 41,
+    "linkedin_daily": 90,
+    "linkedin_competitors": 10,
+}
+
+START = pd.Timestamp("2024-12-10")
+MAX_DAYS = 36500
+DEVICES = ["desktop", "mobile", "total"]
+
+WORDS = INSTAGRAM_KEYWORDS + [
+    "success",
+    "students",
+    "community",
+    "thank",
+    "you",
+    "our",
+    "volunteers",
+    "join",
+    "us",
+    "this",
+    "week",
+    "support",
+    "youth",
+    "detroit",
+    "reading",
+    "goal",
+    "campaign",
+    "families",
+    "today",
+    "#25Kfor2025",
+]
+
+LINKEDIN_DESCRIPTION = (
+    "Aggregated engagement metrics for your organic and sponsored posts over "
+    "time. Date indicates when your posts were viewed by LinkedIn members. "
+    "Data is delayed by up to 2 days. All dates and times are in UTC."
+)
+
+# (row id, metric, windows reported) as in the Instagram insights workbook
+INSIGHT_METRICS = [
+    (0, "Accounts Reached", "90 30 14"),
+    (1, "Followers Reached", "90"),
+    (2, "Non-Followers Reached", "90"),
+    (3, "Post Reach", "90"),
+    (4, "Reel Reach", "90"),
+    (5, "Story Reach", "90"),
+    (6, "Video Reach", "90"),
+    (12, "Accounts Engaged", "90 30 14"),
+    (13, "Followers Engaged", "90"),
+    (14, "Non-Followers Engaged", "90"),
+    (15, "Post Interactions", "90"),
+    (16, "Reel Interactions", "90"),
+    (17, "Story Interactions", "90"),
+    (23, "Profile Activity", "90 30 14"),
+    (24, "Profile Visits", "90 30 14"),
+    (25, "External Link Taps", "90 30"),
+    (26, "Total Followers", "90 30"),
+    (35, "Total Views", "30 14"),
+    (36, "Followers View Percentage", "30 14"),
+    (37, "Non-Followers View Percentage", "30 14"),
+    (38, "Post Views Percentage", "30 14"),
+    (39, "Story Views Percentage", "30 14"),
+    (40, "Reel Views Percentage", "30 14"),
+    (46, "Total Interactions", "30 14"),
+    (47, "Followers Interaction Percentage", "30 14"),
+    (48, "Non-Followers Interaction Percentage", "30 14"),
+    (49, "Post Interaction Percentage", "30 14"),
+    (50, "Reel Interaction Percentage", "30 14"),
+    (51, "Story Interaction Percentage", "30 14"),
+]
+
+
+def _days(scale):
+    return min(BASE_ROWS["linkedin_daily"] * scale, MAX_DAYS)
+
+
+def _post_times(rng, n, scale):
+    # Newest first, like the exports
+    minutes = np.sort(rng.integers(0, _days(scale) * 1440, n))[::-1]
+    return pd.Series(START + pd.to_timedelta(minutes, unit="min"))
+
+
+def _texts(rng, n, pool_size=256):
+    pool = np.array(
+        [
+            " ".join(rng.choice(WORDS, rng.integers(6, 40))).capitalize()
+            for _ in range(pool_size)
+        ],
+        dtype=object,
+    )
+    return pool[rng.integers(0, pool_size, n)]
+
+
+def _rate(numerator, denominator):
+    # "48.0%", as the email platform formats its rates
+    rate = 100 * numerator / np.maximum(denominator, 1)
+    return pd.Series(rate).round(1).astype(str) + "%"
+
+
+def _with_gaps(rng, values, fraction=0.05):
+    values = values.astype(float)
+    values[rng.random(len(values)) < fraction] = np.nan
+    return values
+
+
+def email_clicks(rng, scale):
+    n = BASE_ROWS["email_clicks"] * scale
+    when = _post_times(rng, n, scale)
+    hour12 = (when.dt.hour + 11) % 12 + 1
+    sends = rng.integers(50, 3000, n)
+    bounces = rng.binomial(sends, 0.12)
+    delivered = sends - bounces
+    opens = rng.binomial(delivered, 0.45)
+    clicks = rng.binomial(opens, 0.3)
+    unsubscribes = rng.binomial(delivered, 0.002)
+    mobile = rng.binomial(np.maximum(opens, 1), 0.15)
+    return pd.DataFrame(
+        {
+            "Time Sent": when.dt.strftime("%Y/%m/%d ")
+            + hour12.astype(str)
+            + when.dt.strftime(":%M %p"),
+            "Campaign Name": pd.Series(_texts(rng, n)).str.slice(0, 40)
+            + " #"
+            + pd.Series(np.arange(n)).astype(str),
+            "Sends": sends,
+            "Opens": opens,
+            "Open Rate": _rate(opens, delivered),
+            "Mobile Open Rate": _rate(mobile, opens),
+            "Desktop Open Rate": _rate(np.maximum(opens, 1) - mobile, opens),
+            "Clicks": clicks,
+            "Click Rate": _rate(clicks, delivered),
+            "Bounces": bounces,
+            "Bounce Rate": _rate(bounces, sends),
+            "Unsubscribes": unsubscribes,
+            "Unsubscribe Rate": _rate(unsubscribes, delivered),
+        }
+    )
+
+
+def facebook(rng, scale):
+    n = BASE_ROWS["facebook"] * scale
+    post_ids = 886092916972770 + np.arange(n)
+    reach = rng.poisson(60, n)
+    reactions = rng.poisson(4, n)
+    comments = rng.poisson(0.5, n)
+    shares = rng.poisson(0.3, n)
+    clicks = rng.poisson(3, n)
+    missing = np.full(n, np.nan)
+    post_type = rng.choice(
+        ["Photos", "Text", "Links", "Reels"], n, p=[49 / 56, 4 / 56, 2 / 56, 1 / 56]
+    )
+    return pd.DataFrame(
+        {
+            "Post ID": post_ids,
+            "Page ID": 100067162095753,
+            "Page name": "Center for Success",
+            "Title": _texts(rng, n),
+            "Description": np.where(rng.random(n) < 0.3, _texts(rng, n), None),
+            "Duration (sec)": 0,
+            "Publish time": _post_times(rng, n, scale).dt.strftime("%m/%d/%Y %H:%M"),
+            "Caption type": np.where(post_type == "Reels", "uploaded", "N/A"),
+            "Permalink": "https://www.facebook.com/Center4SuccessNetwork/posts/"
+            + pd.Series(post_ids).astype(str),
+            "Is crosspost": 0,
+            "Is share": 0,
+            "Post type": post_type,
+            "Languages": missing,
+            "Custom labels": missing,
+            "Funded content status": missing,
+            "Data comment": missing,
+            "Date": "Lifetime",
+            "Views": _with_gaps(rng, reach + rng.poisson(40, n)),
+            "Reach": _with_gaps(rng, reach),
+            "IMPRESSION:UNIQUE_USERS": missing,
+            "Reactions, Comments and Shares": _with_gaps(
+                rng, reactions + comments + shares
+            ),
+            "Reactions": _with_gaps(rng, reactions),
+            "Comments": _with_gaps(rng, comments),
+            "Shares": _with_gaps(rng, shares),
+            "Total clicks": _with_gaps(rng, clicks),
+            "Other Clicks": missing,
+            "Matched Audience Targeting Consumption (Photo Click)": missing,
+            "Link Clicks": missing,
+            "Seconds viewed": missing,
+            "Average Seconds viewed": missing,
+            "Estimated earnings (USD)": missing,
+            "Ad impressions": missing,
+        }
+    )
+
+
+def meta_suite(rng, scale):
+    n = BASE_ROWS["meta_suite"] * scale
+    post_type = rng.choice(
+        ["IG image", "IG carousel", "IG reel"], n, p=[33 / 41, 7 / 41, 1 / 41]
+    )
+    reach = rng.poisson(75, n)
+    return pd.DataFrame(
+        {
+            "Post ID": 17935189202838000 + 1000 * np.arange(n),
+            "Account ID": 17841417142633300,
+            "Account username": "centerforsuccessnet",
+            "Account name": "Center for Success Network",
+            "Description": _texts(rng, n),
+            "Duration (sec)": np.where(post_type == "IG reel", 30, 0),
+            "Publish time": _post_times(rng, n, scale),
+            "Permalink": "https://www.instagram.com/p/"
+            + pd.Series(np.arange(n)).astype(str)
+            + "/",
+            "Post type": post_type,
+            "Data comment": np.nan,
+            "Date": "Lifetime",
+            "Views": reach + rng.poisson(45, n),
+            "Reach": reach,
+            "Likes": rng.poisson(5, n),
+            "Shares": rng.poisson(0.3, n),
+            "Comments": rng.poisson(0.4, n),
+            "Saves": rng.poisson(0.2, n),
+            "Follows": np.nan,
+        }
+    )
+
+
+def _daily_dates(scale):
+    return pd.Series(pd.date_range(START, periods=_days(scale), freq="D")).dt.strftime(
+        "%m/%d/%Y"
+    )
+
+
+def linkedin_activity(rng, scale):
+    dates = _daily_dates(scale)
+    n = len(dates)
+    columns = {"Date": dates}
+    for metric, lam in [
+        ("Impressions", 20),
+        ("Clicks", 1),
+        ("Reactions", 1),
+        ("Comments", 0.1),
+        ("Reposts", 0.1),
+    ]:
+        organic = rng.poisson(lam, n)
+        columns[f"{metric} (organic)"] = organic
+        columns[f"{metric} (sponsored)"] = 0
+        columns[f"{metric} (total)"] = organic
+        if metric == "Impressions":
+            columns["Unique impressions (organic)"] = rng.binomial(organic, 0.8)
+    engaged = sum(columns[f"{m} (organic)"] for m in ["Clicks", "Reactions", "Reposts"])
+    rate = engaged / np.maximum(columns["Impressions (organic)"], 1)
+    columns["Engagement rate (organic)"] = rate
+    columns["Engagement rate (sponsored)"] = 0
+    columns["Engagement rate (total)"] = rate
+    data = pd.DataFrame(columns)
+    # Description in the first row, the real header in the second
+    header = pd.DataFrame([list(data.columns)], columns=data.columns)
+    description = pd.DataFrame([[LINKEDIN_DESCRIPTION]], columns=["Date"])
+    return pd.concat([description, header, data.astype(object)], ignore_index=True)
+
+
+def linkedin_followers(rng, scale):
+    dates = _daily_dates(scale)
+    n = len(dates)
+    organic = rng.poisson(0.5, n)
+    invited = rng.poisson(0.05, n)
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Sponsored followers": 0,
+            "Organic followers": organic,
+            "Auto-invited followers": invited,
+            "Total followers": organic + invited,
+        }
+    )
+
+
+def linkedin_visitors(rng, scale):
+    dates = _daily_dates(scale)
+    n = len(dates)
+    columns = {"Date": dates}
+    for section, lam in [("Overview", 2), ("Life", 0.3), ("Jobs", 0.2)]:
+        for device in ["desktop", "mobile"]:
+            views = rng.poisson(lam if device == "desktop" else lam / 2, n)
+            columns[f"{section} page views ({device})"] = views
+            columns[f"{section} unique visitors ({device})"] = rng.binomial(views, 0.7)
+    for measure in ["page views", "unique visitors"]:
+        for device in ["desktop", "mobile"]:
+            columns[f"Total {measure} ({device})"] = sum(
+                columns[f"{section} {measure} ({device})"]
+                for section in ["Overview", "Life", "Jobs"]
+            )
+    # Export column order: section, measure, then desktop / mobile / total
+    frame = pd.DataFrame(columns)
+    ordered = ["Date"]
+    for section in ["Overview", "Life", "Jobs", "Total"]:
+        for measure in ["page views", "unique visitors"]:
+            prefix = f"{section} {measure}"
+            frame[f"{prefix} (total)"] = (
+                frame[f"{prefix} (desktop)"] + frame[f"{prefix} (mobile)"]
+            )
+            ordered += [f"{prefix} ({device})" for device in DEVICES]
+    return frame[ordered]
+
+
+def _short_date(when):
+    # "3/9/2025": the competitor export does not pad months or days
+    return f"{when.month}/{when.day}/{when.year}"
+
+
+def linkedin_competitors(rng, scale):
+    n = BASE_ROWS["linkedin_competitors"] * scale
+    end = START + pd.Timedelta(days=_days(scale) - 1)
+    pages = pd.Series(np.arange(n)).astype(str).radd("Organization ")
+    pages.iloc[0] = "Center for Success Network"
+    rows = pd.DataFrame(
+        {
+            0: pages,
+            1: rng.integers(100, 5000, n),
+            2: rng.integers(10, 250, n),
+            3: rng.integers(50, 2000, n),
+            4: rng.integers(5, 80, n),
+        }
+    )
+    head = pd.DataFrame(
+        [
+            [_short_date(START), _short_date(end)] + [None] * 3,
+            [
+                "Page",
+                "Total Followers",
+                "New Followers",
+                "Total post engagements",
+                "Total posts",
+            ],
+        ]
+    )
+    return pd.concat([head, rows.astype(object)], ignore_index=True)
+
+
+def insta_insights(rng, scale):
+    windows = ["90", "30", "14"]
+    rows = {}
+    for row_id, metric, reported in INSIGHT_METRICS:
+        shares = "Percentage" in metric
+        rows[row_id] = [metric] + [
+            (
+                (round(rng.random(), 3) if shares else int(rng.integers(10, 1500)))
+                if window in reported.split()
+                else None
+            )
+            for window in windows
+        ]
+    return pd.DataFrame.from_dict(
+        rows,
+        orient="index",
+        columns=["Metric"] + [f"{window} Days Value" for window in windows],
+    )
+
+
+def email_overview(rng, scale):
+    open_rate = int(rng.integers(30, 60))
+    desktop_opens = int(rng.integers(60, 100))
+    desktop_clicks = int(rng.integers(60, 100))
+    return (
+        "Send Rates\n"
+        '"Status","Rate"\n'
+        f'"Open Rate",{open_rate}\n'
+        f'"Unopened Rate",{100 - open_rate}\n'
+        f'"Click Rate",{int(rng.integers(5, 25))}\n'
+        f'"Bounce Rate",{int(rng.integers(5, 30))}\n'
+        "Open Rates\n"
+        '"Device","Rate"\n'
+        f'"Desktop",{desktop_opens}\n'
+        f'"Mobile",{100 - desktop_opens}\n'
+        "Click Rates\n"
+        '"Device","Rate"\n'
+        f'"Desktop",{desktop_clicks}\n'
+        f'"Mobile",{100 - desktop_clicks}\n'
+    )
+
+
+# Source -> (generator, writer taking the generated value and the path)
+GENERATORS = {
+    "email_clicks": (
+        email_clicks,
+        lambda df, path: df.to_csv(path, index=False, encoding="utf-8-sig"),
+    ),
+    "email_overview": (email_overview, lambda text, path: path.write_text(text)),
+    "meta_suite": (meta_suite, lambda df, path: df.to_excel(path, index=False)),
+    "insta_insights": (insta_insights, lambda df, path: df.to_excel(path)),
+    "facebook": (
+        facebook,
+        lambda df, path: df.to_csv(path, index=False, encoding="utf-8-sig"),
+    ),
+    "linkedin_followers": (
+        linkedin_followers,
+        lambda df, path: df.to_excel(path, index=False),
+    ),
+    "linkedin_visitors": (
+        linkedin_visitors,
+        lambda df, path: df.to_excel(path, index=False),
+    ),
+    "linkedin_activity": (
+        linkedin_activity,
+        lambda df, path: df.to_excel(path, index=False, header=False),
+    ),
+    "linkedin_competitors": (
+        linkedin_competitors,
+        lambda df, path: df.to_excel(path, index=False, header=False),
+    ),
+}
+
+
+def generate(data_dir, scale=1, seed=0):
+    """Write every export at ``scale`` times its real size into ``data_dir``."""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rows = {}
+    for name, (generator, write) in GENERATORS.items():
+        # One stream per source, so adding a source leaves the others unchanged
+        rng = np.random.default_rng([seed, scale, zlib.crc32(name.encode())])
+        value = generator(rng, scale)
+        write(value, data_dir / SOURCES[name])
+        rows[name] = len(value) if isinstance(value, pd.DataFrame) else None
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic platform exports.")
+    parser.add_argument("data_dir")
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for name, rows in generate(args.data_dir, args.scale, args.seed).items():
+        print(f"{SOURCES[name]}: {rows if rows is not None else 'fixed'} rows")
+
+
+if __name__ == "__main__":
+    main()
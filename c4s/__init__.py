@@ -0,0 +1 @@
+"""Data layer behind the Center for Success marketing dashboard."""
@@ -0,0 +1,193 @@
+"""Group posts from every platform into campaigns by text and timing.
+
+Each post is a TF-IDF vector over its words. Rather than comparing every
+pair of posts, posts are candidates only when they share a term that is
+among the ``KEY_TERMS`` highest-weighted of either one, were published
+within ``MAX_GAP`` of each other and are at most ``NEIGHBOURS`` apart in
+that term's time-ordered postings. Each post is linked to its ``NEAREST``
+candidates whose cosine similarity, halved for every ``HALF_LIFE`` between
+the two posts, reaches ``MIN_SCORE``. Campaigns are the connected groups of
+linked posts, named after their top terms.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+STOP_WORDS = frozenset("""
+    about after all also and any are back been before being but can come
+    could did does don't each every for from get got had has have her here
+    him his how i'm into it's its just let's more most much new not now off
+    once only our out over own see she some such than that the their them
+    then there these they this those through too very was way we're were
+    what when where which while who why will with would you you're your
+    """.split())
+
+KEY_TERMS = 5
+NEIGHBOURS = 10
+MAX_GAP = pd.Timedelta(days=21)
+HALF_LIFE = pd.Timedelta(days=14)
+MIN_SCORE = 0.15
+NEAREST = 2
+
+# Terms in more than this share of posts link unrelated posts
+MAX_DF = 0.5
+
+_WORD = re.compile(r"[a-z][a-z']{2,}")
+
+
+def term_weights(texts):
+    """``(post, term, position, weight)`` rows: L2-normalized TF-IDF weights.
+
+    ``post`` is the position in ``texts``, ``position`` the first word
+    offset of the term in the post.
+    """
+    texts = pd.Series(texts).reset_index(drop=True)
+    words = texts.fillna("").astype(str).str.lower().str.findall(_WORD).explode()
+    words = words.dropna()
+    tokens = pd.DataFrame(
+        {"post": words.index.to_numpy(dtype=np.intp), "term": words.to_numpy()}
+    )
+    tokens["position"] = tokens.groupby("post").cumcount()
+    tokens = tokens[~tokens["term"].isin(STOP_WORDS)]
+    terms = (
+        tokens.groupby(["post", "term"], sort=False)["position"]
+        .agg(["size", "first"])
+        .reset_index()
+        .rename(columns={"size": "tf", "first": "position"})
+    )
+    df = terms.groupby("term")["post"].transform("size")
+    # A term in one post cannot link it to anything
+    keep = (df > 1) & (df <= MAX_DF * len(texts))
+    terms, df = terms[keep], df[keep]
+    weight = terms["tf"] * np.log(len(texts) / df)
+    norm = np.sqrt((weight**2).groupby(terms["post"]).transform("sum"))
+    return terms.assign(weight=weight / norm).drop(columns="tf")
+
+
+def candidate_pairs(terms, times):
+    """Posts sharing a term, key to at least one of them, and close in time."""
+    ranks = (
+        terms.sort_values(["post", "weight"], ascending=[True, False])
+        .groupby("post")
+        .cumcount()
+    )
+    postings = terms.assign(
+        key=ranks < KEY_TERMS, time=times[terms["post"].to_numpy()]
+    ).sort_values(["term", "time"], kind="stable")
+    term = postings["term"].to_numpy()
+    post = postings["post"].to_numpy()
+    key = postings["key"].to_numpy()
+    time = postings["time"].to_numpy()
+    firsts, seconds = [], []
+    for offset in range(1, min(NEIGHBOURS, len(postings) - 1) + 1):
+        # NaT gaps compare false, so undated posts are never candidates
+        keep = (
+            (term[offset:] == term[:-offset])
+            & (key[offset:] | key[:-offset])
+            & (time[offset:] - time[:-offset] <= MAX_GAP.to_timedelta64())
+        )
+        firsts.append(post[:-offset][keep])
+        seconds.append(post[offset:][keep])
+    if not firsts:
+        empty = np.array([], dtype=np.intp)
+        return empty, empty
+    a, b = np.concatenate(firsts), np.concatenate(seconds)
+    pairs = pd.DataFrame({"a": np.minimum(a, b), "b": np.maximum(a, b)})
+    pairs = pairs[pairs["a"] != pairs["b"]].drop_duplicates()
+    return pairs["a"].to_numpy(), pairs["b"].to_numpy()
+
+
+def pair_scores(terms, times, a, b):
+    """Time-decayed cosine similarity of each candidate pair."""
+    terms = terms.sort_values("post", kind="stable")
+    post = terms["post"].to_numpy()
+    code = pd.factorize(terms["term"])[0]
+    weight = terms["weight"].to_numpy()
+    # Every term of each pair's first post, looked up in its second post
+    starts = np.searchsorted(post, a)
+    counts = np.searchsorted(post, a, side="right") - starts
+    pair = np.repeat(np.arange(len(a)), counts)
+    rows = np.arange(counts.sum()) - np.repeat(counts.cumsum() - counts, counts)
+    rows += np.repeat(starts, counts)
+    width = code.max() + 1 if len(code) else 1
+    found = pd.Index(post * width + code).get_indexer(b[pair] * width + code[rows])
+    shared = found >= 0
+    cosine = np.bincount(
+        pair[shared],
+        weights=weight[rows[shared]] * weight[found[shared]],
+        minlength=len(a),
+    )
+    gap = np.abs(times[a] - times[b]) / HALF_LIFE.to_timedelta64()
+    return cosine * 0.5**gap
+
+
+def nearest(a, b, scores):
+    """Each post's ``NEAREST`` best-scoring pairs that reach ``MIN_SCORE``.
+
+    Linking only nearest neighbours keeps weak pairs from chaining two
+    campaigns together.
+    """
+    pairs = pd.DataFrame(
+        {
+            "post": np.concatenate([a, b]),
+            "other": np.concatenate([b, a]),
+            "score": np.concatenate([scores, scores]),
+        }
+    )
+    best = pairs.sort_values("score", ascending=False, kind="stable")
+    best = best.groupby("post", sort=False).head(NEAREST)
+    best = best[best["score"] >= MIN_SCORE]
+    return best["post"].to_numpy(), best["other"].to_numpy()
+
+
+def components(n, a, b):
+    """Connected component label of each of ``n`` posts linked by ``a``-``b``."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        before = labels.copy()
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        # Pointer jumping: follow labels to their own label
+        labels = labels[labels]
+        if np.array_equal(labels, before):
+            return labels
+
+
+def _names(terms, labels):
+    # The three heaviest terms of each campaign, in the order they are
+    # usually written, e.g. "March Book Madness"
+    terms = terms.assign(campaign=labels[terms["post"].to_numpy()])
+    totals = (
+        terms.groupby(["campaign", "term"])
+        .agg(weight=("weight", "sum"), position=("position", "mean"))
+        .reset_index()
+        .sort_values(["campaign", "weight"], ascending=[True, False])
+        .groupby("campaign")
+        .head(3)
+        .sort_values(["campaign", "position"])
+    )
+    return totals.groupby("campaign")["term"].agg(lambda words: " ".join(words).title())
+
+
+def match(posts):
+    """Campaign name of each post in ``posts`` (``time`` and ``text`` columns).
+
+    Posts linked to no other post keep a campaign of their own.
+    """
+    times = posts["time"].to_numpy(dtype="datetime64[ns]")
+    terms = term_weights(posts["text"])
+    a, b = candidate_pairs(terms, times)
+    a, b = nearest(a, b, pair_scores(terms, times, a, b))
+    labels = components(len(posts), a, b)
+    names = _names(terms, labels).reindex(labels).fillna("Untitled").to_numpy()
+
+    campaigns = pd.Series(names, index=posts.index, name="campaign")
+    # Tell apart campaigns with the same top terms by their first month
+    first = posts["time"].groupby(labels).transform("min").dt.strftime("%b %Y")
+    clashes = (
+        pd.Series(labels, index=posts.index).groupby(names).transform("nunique") > 1
+    )
+    return campaigns.where(~clashes, campaigns + " (" + first.to_numpy() + ")")
@@ -0,0 +1,377 @@
+"""Altair charts for each section, built from ``c4s.sections`` aggregates.
+
+Each function builds one chart from its section's aggregates, so a chart
+can be rebuilt without the rest of its page. Long time series are
+downsampled first, see ``c4s.downsample``; ``zoom`` is the ``(start, end)``
+window of the series to show at full point budget. Line charts mark the
+engagement spikes found by ``c4s.spikes`` with dashed rules.
+"""
+
+import altair as alt
+
+from .downsample import reduce_series
+from .prepare import WEEKDAYS
+
+# Chart id -> (time column, value column, series column) of reduced series
+SERIES = {
+    "rates_over_time": ("Time Sent", "Rate", "Rate Type"),
+    "follower_trend": ("Date", "Total followers", None),
+    "engagement_trend": ("Date", "Value", "Metric"),
+    "visitor_views": ("Date", "Views", "Page Section"),
+}
+
+
+def series_data(aggregates, chart_id, zoom=None):
+    x, y, by = SERIES[chart_id]
+    return reduce_series(aggregates[chart_id], x, y, by, window=zoom)
+
+
+def spike_rules(spikes, times=None, color=None):
+    """Dashed rules at the ``spikes``, within the span of ``times`` if given.
+
+    Without a fixed ``color`` the rules are colored by platform.
+    """
+    if times is not None:
+        first, last = times.dt.normalize().min(), times.max()
+        spikes = spikes[spikes["Date"].between(first, last)]
+    encoding = {
+        "x": alt.X("Date:T", title=None),
+        "tooltip": ["Date:T", "Platform:N", "Engagement:Q", "Baseline:Q"],
+    }
+    if color is None:
+        encoding["color"] = "Platform:N"
+    return (
+        alt.Chart(spikes)
+        .mark_rule(strokeDash=[4, 4], color=color or alt.Undefined)
+        .encode(**encoding)
+    )
+
+
+def rates_by_weekday(aggregates):
+    return (
+        alt.Chart(aggregates["rates_by_weekday"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X(
+                "Day of Week:N",
+                sort=WEEKDAYS,
+                axis=alt.Axis(labelAngle=-45),
+            ),
+            y="Rate:Q",
+            color="Rate Type:N",
+            tooltip=["Day of Week", "Rate Type", "Rate"],
+            column=alt.Column("Rate Type:N", spacing=10, title=None),
+        )
+        .properties(width=300, height=400)
+        .encode(
+            x=alt.X(
+                "Day of Week:N",
+                sort=WEEKDAYS,
+                axis=alt.Axis(labelAngle=-45),
+            ),
+            y="Rate:Q",
+            color="Rate Type:N",
+            tooltip=["Day of Week", "Rate Type", "Rate"],
+        )
+        .properties(width=250, height=200)
+    )
+
+
+def rates_over_time(aggregates, zoom=None):
+    rates = series_data(aggregates, "rates_over_time", zoom)
+    return (
+        alt.layer(
+            alt.Chart(rates)
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("Time Sent:T", axis=alt.Axis(labelAngle=-45)),
+                y="Rate:Q",
+                color="Rate Type:N",
+                tooltip=["Time Sent:T", "Rate Type:N", "Rate:Q"],
+            )
+            .interactive(),
+            spike_rules(aggregates["engagement_spikes"], rates["Time Sent"], "gray"),
+        )
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .properties(width=700, height=400)
+    )
+
+
+def top_open(aggregates):
+    return (
+        alt.Chart(aggregates["top_open"], title="Top 10 Open Rates")
+        .mark_bar()
+        .encode(
+            x=alt.X("Open Rate (%):Q", title=None),
+            y=alt.Y(
+                "Campaign Name:N", sort="-x", title=None, axis=alt.Axis(labelLimit=0)
+            ),
+            tooltip=["Campaign Name:N", "Open Rate (%):Q"],
+        )
+        .properties(width=350, height=300)
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .configure_title(anchor="middle")
+    )
+
+
+def top_click(aggregates):
+    return (
+        alt.Chart(aggregates["top_click"], title="Top 10 Click Rates")
+        .mark_bar(color="orange")
+        .encode(
+            x=alt.X("Click Rate (%):Q", title=None),
+            y=alt.Y(
+                "Campaign Name:N", sort="-x", title=None, axis=alt.Axis(labelLimit=0)
+            ),
+            tooltip=["Campaign Name:N", "Click Rate (%):Q"],
+        )
+        .properties(width=350, height=300)
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .configure_title(anchor="middle")
+    )
+
+
+def reach_by_type(aggregates):
+    return (
+        alt.Chart(aggregates["reach_by_type"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("reach:Q", title="Average Reach"),
+            y=alt.Y("post_type:N", sort="-x", title=None),
+            tooltip=["post_type:N", "reach:Q"],
+        )
+        .properties(width=600, height=300)
+    )
+
+
+def reach_by_slot(aggregates):
+    return (
+        alt.Chart(aggregates["reach_by_slot"])
+        .mark_rect()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("hour:O", title="Hour of Day", axis=alt.Axis(labelAngle=0)),
+            y=alt.Y("weekday:N", title=None),
+            color=alt.Color("reach:Q", scale=alt.Scale(scheme="blues")),
+            tooltip=["weekday:N", "hour:O", "reach:Q"],
+        )
+        .properties(width=600, height=400)
+    )
+
+
+def reach_by_theme(aggregates):
+    return (
+        alt.Chart(aggregates["reach_by_theme"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("reach:Q", title="Average Reach"),
+            y=alt.Y("theme:N", sort="-x", title=None),
+            tooltip=["theme:N", "reach:Q"],
+        )
+        .properties(width=600, height=400)
+    )
+
+
+def engagement_by_type(aggregates):
+    return (
+        alt.Chart(aggregates["engagement_by_type"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("Metric:N", title=None, axis=alt.Axis(labelAngle=-45)),
+            y=alt.Y("Average:Q", title="Average Engagement"),
+            color=alt.Color("Metric:N"),
+            column=alt.Column("post_type:N", title=None, spacing=10),
+            tooltip=["post_type:N", "Metric:N", "Average:Q"],
+        )
+        .properties(width=150, height=400)
+    )
+
+
+def follower_trend(aggregates, zoom=None):
+    return (
+        alt.Chart(series_data(aggregates, "follower_trend", zoom))
+        .mark_line(point=True)
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False)
+        .encode(
+            x=alt.X(
+                "Date:T", axis=alt.Axis(labelAngle=-45, format="%b %d", title=None)
+            ),
+            y="Total followers:Q",
+            tooltip=["Date:T", "Total followers:Q"],
+        )
+        .properties(width=600, height=300)
+    )
+
+
+def engagement_trend(aggregates, zoom=None):
+    trend = series_data(aggregates, "engagement_trend", zoom)
+    return (
+        alt.layer(
+            alt.Chart(trend)
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("Date:T", axis=alt.Axis(labelAngle=-45, format="%b %d")),
+                y=alt.Y("Value:Q", title=None),
+                color=alt.Color(
+                    "Metric:N",
+                    scale=alt.Scale(
+                        domain=["Impressions", "Engagement"],
+                        range=["#1179b0", "orange"],
+                    ),
+                ),
+                tooltip=["Date:T", "Metric:N", "Value:Q"],
+            ),
+            spike_rules(aggregates["engagement_spikes"], trend["Date"], "orange"),
+        )
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .properties(width=600, height=300)
+    )
+
+
+def visitor_views(aggregates, zoom=None):
+    return (
+        alt.Chart(series_data(aggregates, "visitor_views", zoom))
+        .mark_line(point=True)
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("Date:T", axis=alt.Axis(labelAngle=-45, format="%b %d")),
+            y="Views:Q",
+            color="Page Section:N",
+            tooltip=["Date:T", "Page Section:N", "Views:Q"],
+        )
+        .properties(width=700, height=300)
+    )
+
+
+def competitors(aggregates):
+    return (
+        alt.Chart(aggregates["competitors"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("Engagement per Post:Q", title="Engagement per Post"),
+            y=alt.Y(
+                "Organization:N", sort="-x", title=None, axis=alt.Axis(labelLimit=0)
+            ),
+            tooltip=["Organization", "Engagement per Post"],
+        )
+        .properties(width=700, height=300)
+    )
+
+
+def platform_totals(aggregates):
+    return (
+        alt.Chart(aggregates["platform_totals"])
+        .mark_bar()
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .encode(
+            x=alt.X("Value:Q", title=None),
+            y=alt.Y("Metric:N", sort="-x", title=None, axis=alt.Axis(labels=False)),
+            row=alt.Row("Platform:N", sort="ascending", title=None),
+            color="Metric:N",
+            tooltip=["Platform:N", "Metric:N", "Value:Q"],
+        )
+        .properties(width=500, height=100)
+    )
+
+
+def campaign_presence(aggregates):
+    return (
+        alt.Chart(aggregates["campaign_presence"])
+        .transform_calculate(present='datum.Presence === "✅" ? 1 : 0')
+        .mark_rect()
+        .encode(
+            x=alt.X("Platform:N", title=None, axis=alt.Axis(labelAngle=0)),
+            y=alt.Y(
+                "Campaign/Theme:N",
+                sort=alt.EncodingSortField("Engagement", op="sum", order="descending"),
+                title=None,
+                axis=alt.Axis(labelLimit=0),
+            ),
+            color=alt.Color(
+                "present:Q",
+                scale=alt.Scale(domain=[0, 1], range=["#ffffff", "#1179b0"]),
+                legend=alt.Legend(
+                    title="Presence",
+                    orient="right",
+                    values=[0, 1],
+                    labelExpr="datum.value === 1 ? 'Yes' : 'No'",
+                ),
+            ),
+            tooltip=["Campaign/Theme", "Platform", "Posts:Q", "Engagement:Q"],
+        )
+        .properties(width=600, height=300)
+    )
+
+
+def monthly_engagement(aggregates):
+    monthly = aggregates["monthly_engagement"]
+    return (
+        alt.layer(
+            alt.Chart(monthly)
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("Month:T", title=None),
+                y=alt.Y("Engagement:Q", title="Engagement"),
+                color="Platform:N",
+                tooltip=["Month:T", "Platform:N", "Engagement:Q"],
+            )
+            .interactive(),
+            spike_rules(aggregates["engagement_spikes"]),
+        )
+        .configure_view(stroke=None)
+        .configure_axis(grid=False, domain=False, title=None)
+        .properties(width=700, height=300)
+    )
+
+
+# Section -> chart id -> builder
+CHARTS = {
+    "email": {
+        "rates_by_weekday": rates_by_weekday,
+        "rates_over_time": rates_over_time,
+        "top_open": top_open,
+        "top_click": top_click,
+    },
+    "instagram": {
+        "reach_by_type": reach_by_type,
+        "reach_by_slot": reach_by_slot,
+        "reach_by_theme": reach_by_theme,
+    },
+    "facebook": {
+        "engagement_by_type": engagement_by_type,
+    },
+    "linkedin": {
+        "follower_trend": follower_trend,
+        "engagement_trend": engagement_trend,
+        "visitor_views": visitor_views,
+        "competitors": competitors,
+    },
+    "cross_platform": {
+        "platform_totals": platform_totals,
+        "campaign_presence": campaign_presence,
+        "monthly_engagement": monthly_engagement,
+    },
+}
+
+
+def build_charts(section, aggregates):
+    """``{chart_id: chart}`` of every chart of ``section``, unzoomed."""
+    return {chart_id: build(aggregates) for chart_id, build in CHARTS[section].items()}
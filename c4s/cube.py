@@ -0,0 +1,233 @@
+"""Materialized engagement cube over platform x date x weekday x hour x post type.
+
+Every measure is additive, so any chart aggregate is a cheap ``rollup`` of
+the cube. Averages and rates are derived from the rolled-up sums and their
+count denominators (``posts``, delivered sends) rather than by averaging
+per-row percentages.
+"""
+
+import pandas as pd
+
+from .prepare import WEEKDAYS
+from .store import has_table, read_table
+from .stream import is_streamed, iter_prepared
+from .window import sort_by_time, time_slice
+
+DIMENSIONS = ["platform", "date", "weekday", "hour", "post_type"]
+
+MEASURES = [
+    "sends",
+    "bounces",
+    "opens",
+    "clicks",
+    "reach",
+    "impressions",
+    "views",
+    "likes",
+    "comments",
+    "shares",
+    "engagement",
+    "posts",
+]
+
+
+def _facts(platform, when, post_type, measures):
+    facts = pd.DataFrame(
+        {
+            "platform": platform,
+            "date": when.dt.normalize(),
+            "weekday": pd.Categorical(
+                when.dt.day_name(), categories=WEEKDAYS, ordered=True
+            ),
+            "hour": when.dt.hour.astype("Int8"),
+            "post_type": post_type,
+        }
+    )
+    for measure in MEASURES:
+        facts[measure] = measures.get(measure, 0)
+    facts["posts"] = 1
+    return facts
+
+
+def email_facts(df):
+    return _facts(
+        "Email",
+        df["Time Sent"],
+        "email",
+        {
+            "sends": df["Sends"],
+            "bounces": df["Bounces"],
+            "opens": df["Opens"],
+            "clicks": df["Clicks"],
+        },
+    )
+
+
+def instagram_facts(df):
+    return _facts(
+        "Instagram",
+        df["publish_time"],
+        df["post_type"],
+        {
+            "reach": df["reach"],
+            "views": df["views"],
+            "likes": df["likes"],
+            "comments": df["comments"],
+            "shares": df["shares"],
+            "engagement": df["likes"] + df["comments"] + df["shares"],
+        },
+    )
+
+
+def facebook_facts(df):
+    return _facts(
+        "Facebook",
+        df["publish_time"],
+        df["post_type"],
+        {
+            "reach": df["reach"],
+            "views": df["views"],
+            "likes": df["reactions"],
+            "comments": df["comments"],
+            "shares": df["shares"],
+            "clicks": df["total_clicks"],
+            "engagement": df["total_engagement"],
+        },
+    )
+
+
+def linkedin_facts(df):
+    # Daily page totals: no hour or post type, one "post" row per day
+    facts = _facts(
+        "LinkedIn",
+        df["Date"],
+        pd.NA,
+        {
+            "impressions": df["Impressions (total)"],
+            "clicks": df["Clicks (total)"],
+            "likes": df["Reactions (total)"],
+            "comments": df["Comments (total)"],
+            "shares": df["Reposts (total)"],
+            "engagement": df["Total Engagement"],
+        },
+    )
+    facts["hour"] = pd.NA
+    return facts
+
+
+# Platform -> (prepared source, fact extractor)
+PLATFORMS = {
+    "Email": ("email_clicks", email_facts),
+    "Instagram": ("meta_suite", instagram_facts),
+    "Facebook": ("facebook", facebook_facts),
+    "LinkedIn": ("linkedin_activity", linkedin_facts),
+}
+
+
+def build_cube(platform, df):
+    """Aggregate one platform's prepared frame to cube cells."""
+    facts = PLATFORMS[platform][1](df)
+    facts["post_type"] = facts["post_type"].astype("string")
+    facts[MEASURES] = facts[MEASURES].apply(pd.to_numeric, errors="coerce")
+    return (
+        facts.groupby(DIMENSIONS, dropna=False, observed=True)[MEASURES]
+        .sum()
+        .reset_index()
+    )
+
+
+def combine_cubes(cubes):
+    """Sum the cells of several cubes, e.g. built from chunks of one export."""
+    return (
+        pd.concat(cubes, ignore_index=True)
+        .groupby(DIMENSIONS, dropna=False, observed=True)[MEASURES]
+        .sum()
+        .reset_index()
+    )
+
+
+def stream_cube(platform, data_dir="."):
+    """``build_cube`` over the export read in chunks, folded as it goes."""
+    cube = None
+    for chunk in iter_prepared(PLATFORMS[platform][0], data_dir):
+        cells = build_cube(platform, chunk)
+        cube = cells if cube is None else combine_cubes([cube, cells])
+    return cube
+
+
+def cube_table(platform):
+    return f"cube/{platform}"
+
+
+def load_cube(dataset, *platforms, window=None):
+    """Cube cells for ``platforms``, built once per source version.
+
+    Platforms maintained by ``c4s.ingest`` read their persisted cells, which
+    ingestion updates month by month, instead of rebuilding them. Exports
+    too large to load whole are folded in chunks, see ``c4s.stream``.
+
+    With a date ``window`` only the cells of those dates are returned, a
+    slice of the cells sorted by date.
+    """
+    parts = []
+    for platform in platforms or PLATFORMS:
+        source = PLATFORMS[platform][0]
+        key = f"cube.{platform}"
+        if has_table(cube_table(platform), dataset.data_dir):
+            parts.append(
+                dataset.cached(
+                    key,
+                    lambda platform=platform: read_table(
+                        cube_table(platform), dataset.data_dir
+                    ),
+                    source,
+                )
+            )
+        elif is_streamed(source, dataset.data_dir):
+            parts.append(
+                dataset.cached(
+                    key,
+                    lambda platform=platform: stream_cube(platform, dataset.data_dir),
+                    source,
+                )
+            )
+        else:
+            parts.append(
+                dataset.derive(
+                    key,
+                    lambda df, platform=platform: build_cube(platform, df),
+                    source,
+                )
+            )
+        if window is not None:
+            cells = dataset.cached(
+                f"{key}.by_date",
+                lambda cells=parts[-1]: sort_by_time(cells, "date"),
+                source,
+            )
+            parts[-1] = time_slice(cells, "date", window)
+    return pd.concat(parts, ignore_index=True)
+
+
+def rollup(cube, by, measures=None):
+    """Sum ``measures`` over the cube grouped by dimensions in ``by``.
+
+    ``"month"`` is accepted as a coarser grain of ``date``.
+    """
+    keys = [
+        cube["date"].dt.to_period("M").rename("month") if dim == "month" else dim
+        for dim in by
+    ]
+    return (
+        cube.groupby(keys, observed=True)[measures or MEASURES].sum().reset_index()
+    )
+
+
+def per_post(rolled, measures):
+    """Average per post of each measure, weighted by post counts."""
+    return rolled[measures].div(rolled["posts"], axis=0)
+
+
+def weighted_rate(numerator, denominator):
+    """Percentage of summed counts, e.g. opens over delivered sends."""
+    return 100 * numerator / denominator.where(denominator > 0)
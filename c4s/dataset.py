@@ -0,0 +1,175 @@
+"""Process-wide, read-only handle on the prepared frames."""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from .cache import LRUCache
+from .prepare import TIME_COLUMNS, load_prepared, load_text
+from .sources import build_cache, is_cached, source_path, source_version
+from .store import has_table
+from .window import sort_by_time, time_slice, time_span
+
+if int(pd.__version__.split(".")[0]) < 3:
+    # The views handed out below rely on copy-on-write, the default from 3.0
+    pd.set_option("mode.copy_on_write", True)
+
+
+LOAD_WORKERS = int(os.environ.get("C4S_LOAD_WORKERS", 0)) or min(8, os.cpu_count() or 1)
+
+# Smaller xlsx files parse faster than a worker process starts
+PROCESS_BYTES = 1 << 20
+
+
+def _timed_build_cache(name, data_dir):
+    started = time.perf_counter()
+    build_cache(name, data_dir)
+    return time.perf_counter() - started
+
+
+class Dataset:
+    """Prepared frames shared by every session and rerun.
+
+    ``frame`` returns a copy-on-write view of the one shared frame, so a
+    caller that assigns a column only copies that column and never touches
+    what other sessions see. Values computed from the frames are memoized
+    with ``derive`` instead of being written back as columns.
+    """
+
+    def __init__(self, data_dir="."):
+        self.data_dir = data_dir
+        self._frames = {}
+        self._derived = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self.load_seconds = {}
+        # Results over date windows: only the recently used ones are kept
+        self._windows = LRUCache(maxsize=64)
+
+    def _lock(self, key):
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def version(self, name):
+        return source_version(name, self.data_dir)
+
+    def _shared(self, name):
+        version = self.version(name)
+        cached = self._frames.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # One loader per source; other sources keep loading concurrently
+        with self._lock(("frame", name)):
+            cached = self._frames.get(name)
+            if cached is None or cached[0] != version:
+                cached = (version, load_prepared(name, self.data_dir))
+                self._frames[name] = cached
+        return cached[1]
+
+    def _needs_process(self, name):
+        # Ingested sources are read from the store and may have no export
+        # left on disk
+        if has_table(name, self.data_dir):
+            return False
+        path = source_path(name, self.data_dir)
+        return (
+            path.suffix != ".csv"
+            and path.exists()
+            and path.stat().st_size > PROCESS_BYTES
+            and not is_cached(name, self.data_dir)
+        )
+
+    def _load(self, name, processes):
+        parse_seconds = 0.0
+        if processes is not None and self._needs_process(name):
+            # openpyxl parses in pure Python: build the cache in a process,
+            # then this thread only reads the Parquet copy. Time spent
+            # queueing for a free process is not counted.
+            parse_seconds = processes.submit(
+                _timed_build_cache, name, self.data_dir
+            ).result()
+        started = time.perf_counter()
+        self._shared(name)
+        self.load_seconds[name] = parse_seconds + time.perf_counter() - started
+        return self.load_seconds[name]
+
+    def preload(self, names, workers=None):
+        """Load ``names`` concurrently; returns seconds per source.
+
+        CSVs and cached exports load on threads, large uncached xlsx files
+        are parsed in worker processes, so a cold start costs about the
+        slowest file rather than the sum of them.
+        """
+        workers = workers or LOAD_WORKERS
+        names = list(dict.fromkeys(names))
+        processes = None
+        if workers > 1 and any(self._needs_process(name) for name in names):
+            processes = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            with ThreadPoolExecutor(workers) as threads:
+                futures = {
+                    name: threads.submit(self._load, name, processes) for name in names
+                }
+                return {name: future.result() for name, future in futures.items()}
+        finally:
+            if processes is not None:
+                processes.shutdown()
+
+    def frame(self, name, window=None):
+        """Prepared frame of ``name``, limited to the dates in ``window``.
+
+        A windowed frame is a slice of the frame sorted by time, so its rows
+        are in time order rather than export order.
+        """
+        if window is None or name not in TIME_COLUMNS:
+            return self._shared(name).copy(deep=False)
+        return time_slice(self.by_time(name), TIME_COLUMNS[name], window).copy(
+            deep=False
+        )
+
+    def by_time(self, name):
+        """Shared frame of ``name`` sorted by time, undated rows last."""
+        return self.derive(
+            f"{name}.by_time", lambda df: sort_by_time(df, TIME_COLUMNS[name]), name
+        )
+
+    def time_span(self, name):
+        """First and last time in ``name``, or ``None``."""
+        return time_span(self.by_time(name), TIME_COLUMNS[name])
+
+    def text(self, name):
+        """Free-text columns of ``name``, aligned with ``frame(name)``."""
+        return self.cached(
+            f"{name}.text", lambda: load_text(name, self.data_dir), name
+        ).copy(deep=False)
+
+    def cached(self, key, func, *names, window=None):
+        """Memoize ``func()`` until any of the named sources changes.
+
+        The result is shared as well; callers must not modify it. Results
+        for a date ``window`` are kept for the most recent windows only.
+        """
+        versions = tuple(self.version(name) for name in names)
+        if window is not None:
+            return self._windows.get_or_create((key, window, versions), func)
+        cached = self._derived.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        with self._lock(("derived", key)):
+            cached = self._derived.get(key)
+            if cached is None or cached[0] != versions:
+                cached = (versions, func())
+                self._derived[key] = cached
+        return cached[1]
+
+    def derive(self, key, func, *names):
+        """Memoize ``func(*frames)`` of the named sources, see ``cached``."""
+        return self.cached(
+            key, lambda: func(*(self.frame(name) for name in names)), *names
+        )
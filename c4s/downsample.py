@@ -0,0 +1,101 @@
+"""Reduce long time series before they are serialized into a chart spec.
+
+Vega-Lite gets every row inline, so multi-year daily data makes both the
+payload and the browser the bottleneck. ``reduce_series`` first averages
+each series into bins of the coarsest calendar grain that still leaves
+several candidates per output point, then keeps ``max_points`` of them with
+Largest-Triangle-Three-Buckets, which preserves peaks and troughs that plain
+averaging flattens. Series that already fit are returned unchanged.
+"""
+
+import numpy as np
+import pandas as pd
+
+MAX_POINTS = 500
+
+# Candidate bins per output point when choosing the pre-binning grain
+OVERSAMPLE = 4
+
+# Pre-binning grains, finest first, with their approximate width
+GRAINS = [
+    ("min", pd.Timedelta(minutes=1)),
+    ("h", pd.Timedelta(hours=1)),
+    ("D", pd.Timedelta(days=1)),
+    ("W", pd.Timedelta(weeks=1)),
+    ("M", pd.Timedelta(days=31)),
+]
+
+
+def lttb_indices(x, y, n_out):
+    """Positions of the ``n_out`` points LTTB keeps from sorted ``x``, ``y``."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # First and last points are always kept; the rest are split in buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0] = 0
+    keep[-1] = n - 1
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < n_out - 1:
+            next_x = x[stop : edges[i + 2]].mean()
+            next_y = y[stop : edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        prev_x, prev_y = x[keep[i]], y[keep[i]]
+        area = np.abs(
+            (prev_x - next_x) * (y[start:stop] - prev_y)
+            - (prev_x - x[start:stop]) * (next_y - prev_y)
+        )
+        keep[i + 1] = start + int(np.argmax(area))
+    return keep
+
+
+def _bin_starts(times, max_points):
+    span = times.max() - times.min()
+    for grain, width in GRAINS:
+        if span / width <= max_points * OVERSAMPLE:
+            break
+    if grain in ("W", "M"):
+        return times.dt.to_period(grain).dt.start_time
+    return times.dt.floor(grain)
+
+
+def _reduce_one(frame, x, y, max_points):
+    frame = frame.dropna(subset=[x, y])
+    starts = _bin_starts(frame[x], max_points)
+    labels = {col: "first" for col in frame.columns if col not in (x, y)}
+    frame = (
+        frame.groupby(starts.rename(x), sort=True)
+        .agg({y: "mean", **labels})
+        .reset_index()[list(frame.columns)]
+    )
+    if len(frame) <= max_points:
+        return frame
+    times = frame[x].to_numpy(dtype="datetime64[ns]").view("int64").astype(float)
+    keep = lttb_indices(times, frame[y].to_numpy(dtype=float), max_points)
+    return frame.iloc[keep]
+
+
+def reduce_series(frame, x, y, by=None, max_points=MAX_POINTS, window=None):
+    """At most ``max_points`` rows per series of ``frame``.
+
+    ``by`` names the column telling series apart, ``window`` an optional
+    ``(start, end)`` range of ``x``: zooming in to a narrower window keeps
+    the same number of points over it, so resolution goes up.
+    """
+    if window is not None:
+        frame = frame[frame[x].between(*window)]
+    sizes = frame.groupby(by, sort=False).size() if by else pd.Series([len(frame)])
+    if sizes.empty or sizes.max() <= max_points:
+        return frame
+    if by is None:
+        return _reduce_one(frame, x, y, max_points)
+    return pd.concat(
+        [
+            _reduce_one(series, x, y, max_points)
+            for _, series in frame.groupby(by, sort=False)
+        ],
+        ignore_index=True,
+    )
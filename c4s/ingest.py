@@ -0,0 +1,124 @@
+"""Append new platform exports to the persistent store.
+
+    python -m c4s.ingest facebook ~/Downloads/facebook_published.csv
+
+Rows are deduplicated on the platform's natural key, and for rows present in
+several exports the export with the newest file time wins. Only the months
+the new export touches are rewritten, together with their cube cells, so
+adding a month of data costs about a month of work.
+
+The first ingest of a source seeds the store with the export already in the
+data directory, so no history is lost when the dashboard switches over.
+"""
+
+import argparse
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+
+from .cube import build_cube, cube_table
+from .prepare import PREPARERS
+from .sources import read_export, source_path
+from .store import UNDATED, has_table, read_partition, table_lock, write_partitions
+
+Ingestible = namedtuple("Ingestible", ["keys", "time_column", "platform"])
+
+# Source -> dedup key (raw export columns), prepared timestamp, cube platform.
+# Posts are keyed on their permalink: Excel rounds the 17-digit Post IDs of
+# the xlsx exports, so the same post has different IDs in the CSV variant.
+INGESTIBLE = {
+    "facebook": Ingestible(["Permalink"], "publish_time", "Facebook"),
+    "meta_suite": Ingestible(["Permalink"], "publish_time", "Instagram"),
+    "email_clicks": Ingestible(["Campaign Name", "Time Sent"], "Time Sent", "Email"),
+}
+
+EXPORTED_AT = "_exported_at"
+
+
+def _months(name, rows):
+    when = PREPARERS[name](rows)[INGESTIBLE[name].time_column]
+    return when.dt.strftime("%Y-%m").fillna(UNDATED).to_numpy()
+
+
+def _without_bookkeeping(frame):
+    return frame.drop(columns=[col for col in frame.columns if col.startswith("_")])
+
+
+def _merge(name, export_path, data_dir):
+    spec = INGESTIBLE[name]
+    rows = read_export(export_path)
+    rows[EXPORTED_AT] = Path(export_path).stat().st_mtime_ns
+
+    touched = {}
+    added = updated = 0
+    for month, new_rows in rows.groupby(_months(name, rows)):
+        old = read_partition(name, month, data_dir)
+        if old is None:
+            old = new_rows.iloc[:0]
+        updated += len(old[spec.keys].merge(new_rows[spec.keys].drop_duplicates()))
+        merged = (
+            pd.concat([old, new_rows], ignore_index=True)
+            .sort_values(EXPORTED_AT, kind="stable")
+            .drop_duplicates(spec.keys, keep="last")
+            .reset_index(drop=True)
+        )
+        added += len(merged) - len(old)
+        touched[month] = merged
+
+    # Cube cells go first: readers only switch once the source manifest moves
+    cells = {
+        month: build_cube(spec.platform, PREPARERS[name](_without_bookkeeping(frame)))
+        for month, frame in touched.items()
+    }
+    write_partitions(cube_table(spec.platform), cells, data_dir)
+    write_partitions(name, touched, data_dir)
+    return {
+        "rows": len(rows),
+        "added": added,
+        "updated": updated,
+        "months": sorted(touched),
+    }
+
+
+def ingest(name, export_path, data_dir="."):
+    """Merge one export into the store and refresh the affected cube cells."""
+    if name not in INGESTIBLE:
+        raise ValueError(
+            f"{name!r} cannot be ingested; choose one of {', '.join(INGESTIBLE)}"
+        )
+    # One ingest of a source at a time: each merges into the partitions the
+    # previous one wrote. The source's cube cells are only written here.
+    with table_lock(name, data_dir):
+        seeded = None
+        if not has_table(name, data_dir):
+            seed = source_path(name, data_dir)
+            if seed.exists() and not seed.samefile(export_path):
+                seeded = _merge(name, seed, data_dir)
+        summary = _merge(name, export_path, data_dir)
+    summary["seeded"] = seeded
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Append platform exports to the persistent store."
+    )
+    parser.add_argument("source", choices=sorted(INGESTIBLE))
+    parser.add_argument("exports", nargs="+", type=Path)
+    parser.add_argument("--data-dir", default=".")
+    args = parser.parse_args(argv)
+
+    for export in args.exports:
+        summary = ingest(args.source, export, args.data_dir)
+        if summary["seeded"]:
+            seed = source_path(args.source, args.data_dir)
+            print(f"seeded store with {seed}: {summary['seeded']['rows']} rows")
+        print(
+            f"{export}: {summary['rows']} rows, {summary['added']} new, "
+            f"{summary['updated']} updated, months {', '.join(summary['months'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
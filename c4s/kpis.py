@@ -0,0 +1,84 @@
+"""Headline numbers of every platform for a date window.
+
+One rollup of the engagement cube gives each platform's reach, engagement
+and posts. Unique accounts reached and engaged and profile visits are not
+additive, so Instagram's come from the insights export instead, which
+reports them for trailing periods ending with the Meta export: the longest
+period that fits in the window replaces the post sums. LinkedIn profile
+visits are the unique visitors of its visitors export.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .cube import load_cube, rollup
+
+PLATFORMS = ["Instagram", "Facebook", "LinkedIn"]
+KPIS = ["Reach", "Engagements", "Profile Visits", "Posts"]
+
+# Insights metric -> KPI it reports for Instagram
+INSIGHT_KPIS = {
+    "Accounts Reached": "Reach",
+    "Accounts Engaged": "Engagements",
+    "Profile Visits": "Profile Visits",
+}
+
+SOURCES = [
+    "meta_suite",
+    "insta_insights",
+    "facebook",
+    "linkedin_activity",
+    "linkedin_visitors",
+]
+
+
+def insights_period(end, window, periods):
+    """Longest of ``periods`` (days, ending at ``end``) inside ``window``."""
+    if window is None:
+        return max(periods)
+    first, last = (pd.Timestamp(day) for day in window)
+    for days in sorted(periods, reverse=True):
+        if first <= end - pd.Timedelta(days=days) and last >= end:
+            return days
+    return None
+
+
+def _table(dataset, window):
+    totals = (
+        rollup(load_cube(dataset, *PLATFORMS, window=window), ["platform"])
+        .set_index("platform")
+        .reindex(PLATFORMS, fill_value=0)
+    )
+    table = pd.DataFrame(
+        {
+            # LinkedIn reports impressions rather than reach
+            "Reach": np.where(
+                totals.index == "LinkedIn", totals["impressions"], totals["reach"]
+            ),
+            "Engagements": totals["engagement"],
+            "Profile Visits": np.nan,
+            "Posts": totals["posts"],
+        },
+        index=PLATFORMS,
+    )
+
+    visitors = dataset.frame("linkedin_visitors", window)
+    table.loc["LinkedIn", "Profile Visits"] = visitors[
+        "Total unique visitors (total)"
+    ].sum()
+
+    insights = dataset.frame("insta_insights")
+    # The insights periods end on the last day of the Meta export
+    end = load_cube(dataset, "Instagram")["date"].max()
+    days = insights_period(end, window, list(insights.columns))
+    if days is not None:
+        reported = insights[days].reindex(list(INSIGHT_KPIS))
+        table.loc["Instagram", list(INSIGHT_KPIS.values())] = reported.to_numpy()
+    return table.rename_axis("Platform").reset_index()
+
+
+def kpi_table(dataset, window=None):
+    """``Platform`` and ``KPIS`` columns, cached per export versions and window."""
+    return dataset.cached(
+        "kpis", lambda: _table(dataset, window), *SOURCES, window=window
+    )
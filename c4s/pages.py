@@ -0,0 +1,272 @@
+"""Headings, narrative and chart layout of each dashboard page.
+
+The dashboard and the static prerender both draw a page from its blocks, so
+a snapshot shows the same charts and text as the live app. A block is one
+of ``("subheader", text)``, ``("markdown", text)``, ``("chart", chart_id)``,
+``("columns", [chart_id, ...])`` or ``("wordcloud", aggregate)``, the word
+cloud of the titles in that aggregate.
+"""
+
+TITLE = "Center for Success: Social Media Marketing Analytics Dashboard"
+
+# Section -> (header, blocks)
+PAGES = {
+    "email": (
+        "Email Marketing Performance",
+        [
+            ("subheader", "What days of the week are best for sending emails?"),
+            ("chart", "rates_by_weekday"),
+            (
+                "markdown",
+                "Engagement is consistently stronger on Wednesdays and Thursdays, with both open and click rates peaking midweek. This suggests that audiences are more responsive during these days, likely due to routine checking of email midweek. We should prioritize scheduling important email campaigns for midweek delivery to maximize impact.",
+            ),
+            ("subheader", "How have our email open and click rates changed over time?"),
+            ("chart", "rates_over_time"),
+            (
+                "markdown",
+                "There’s a noticeable rise in click and open rates during campaign bursts in late December and early March. This suggests that time-sensitive or seasonal content (e.g., year-end wrap-ups or events like March Book Madness) significantly boosts engagement. Scheduling similar campaigns in key periods could improve performance.",
+            ),
+            (
+                "subheader",
+                "Which email campaigns had the highest click and open rates, and what made them successful?",
+            ),
+            ("columns", ["top_open", "top_click"]),
+            (
+                "markdown",
+                'Campaigns with high open rates don\'t always guarantee high click rates. For instance, "[Reminder] Party for Langston" had a strong open rate but low clicks, suggesting interest didn\'t translate into action. By contrast, the "EOY 2024" emails show consistent performance across both metrics.',
+            ),
+            ("subheader", "Summary"),
+            (
+                "markdown",
+                """
+    - Over the past few months, our email campaigns have shown encouraging trends in engagement, particularly during key periods like year-end (EOY) and event-driven campaigns (e.g., March Book Madness). Open rates have consistently hovered around 40–50%, with click rates peaking above 15–17% for the best-performing campaigns.
+
+    - High-performing campaigns not only had engaging subject lines but were also time-sensitive, seasonal, or event-focused, indicating that urgency and relevance are strong motivators for our audience.
+
+    - Our analysis also revealed that Wednesdays and Thursdays are the most effective days for sending emails, suggesting that timing plays a critical role in campaign performance.
+    """,
+            ),
+            ("subheader", "Recommendations"),
+            (
+                "markdown",
+                """
+    1. **Send Emails Midweek**:
+    Try sending important emails on Wednesdays or Thursdays. These days tend to get better attention and more clicks.
+
+    2. **Repeat What Worked Well**:
+    Look at past successful emails like the EOY 2024 and March Book Madness campaigns. Use similar styles or formats in future emails.
+
+    3. **Use Timely Topics**:
+    Plan emails around holidays, seasons, or special events. These types of emails usually get more people to open and click.
+
+    4. **Write Better Subject Lines**:
+    Keep subject lines short, clear, and to the point. It helps to test a few versions to see which one gets more opens.
+
+    5. **Clean Up the Email List**:
+    Some emails bounced because the addresses weren’t valid. It’s a good idea to double-check the list every now and then so we’re not emailing bad addresses.
+
+    6. **Make It Easy to Click**:
+    The best emails had a clear message and one strong button or link. Try to include just one thing you want people to do.
+    """,
+            ),
+        ],
+    ),
+    "instagram": (
+        "Instagram Performance",
+        [
+            ("subheader", "Overview"),
+            (
+                "markdown",
+                """
+    - **High Visibility, Moderate Engagement**: The account reached 1,279 users, but only 82 users actually engaged (likes, comments, saves, etc.). This suggests there’s good visibility, but opportunities to increase active engagement—possibly through stronger CTAs or more interactive content.
+    - **Reels Are Seen, but Not Acted On**: Reel Reach (446) is about 46% of Post Reach (978), but Reel Interactions are only 19. This indicates that while people are watching Reels, they’re not interacting much. Adding polls, questions, or clearer CTAs may help.
+    - **Strong Profile Conversion**: 281 profile actions, of which 266 were profile visits, shows a high conversion rate from content to curiosity. This is a good sign that content is motivating viewers to learn more.
+    - **Stories are Underperforming**: Story Reach (215) and Story Interactions (13) are low compared to posts and reels. Stories could be optimized with more interactive elements like stickers, questions, or polls.
+    - **Most Engagement Comes from Followers**: While most reach comes from non-followers, engagement is mostly from followers (69 out of 82). This means while content is discoverable, only followers are actively engaging—so there may be a need to make content more engaging for new viewers.
+    """,
+            ),
+            (
+                "subheader",
+                "What kind of content drives the most reach and engagement on Instagram?",
+            ),
+            ("chart", "reach_by_type"),
+            (
+                "markdown",
+                "IG image posts currently generate the highest reach on average. Carousels and other formats have slightly lower engagement. Maintaining a strong focus on image posts is effective, but experimenting more with carousels and videos could help uncover additional high-performing formats.",
+            ),
+            ("subheader", "When is the best time to post to get the most interaction?"),
+            ("chart", "reach_by_slot"),
+            (
+                "markdown",
+                "Tuesday at 12 PM is the best-performing slot overall. Additionally, early mornings on Monday and Wednesday consistently show strong reach, suggesting these days are ideal for posting important updates or content.",
+            ),
+            ("subheader", "What content topics lead to high engagement?"),
+            ("chart", "reach_by_theme"),
+            (
+                "markdown",
+                'Words like "celebrate", "community", "thankful", and "event" appear frequently in high-engagement posts. This reinforces the idea that posts centered around gratitude, recognition, and shared moments resonate strongly with the audience.',
+            ),
+            ("subheader", "Summary"),
+            (
+                "markdown",
+                """
+    - 1,279 Accounts Reached — strong visibility overall
+    - Reels are the Top-Performing Format, averaging 196 reach per post
+    - Majority of Reach (73%) came from Non-Followers, showing good discoverability
+    - Only 6% of Reach Converted to Engagement, indicating room to improve interaction
+    - Best posting times: Tuesdays at 12 PM, and early weekday mornings
+    - Top-performing themes: “Event”, “Party”, and “Celebrate”-style content
+    """,
+            ),
+            ("subheader", "Recommendations"),
+            (
+                "markdown",
+                """
+    1. **Prioritize Reels in Your Content Strategy**: Reels deliver the highest reach and should be posted regularly. Use trending audio, captions, and call-to-actions to maximize their performance.
+    2. **Post During High-Engagement Windows**: Focus on Tuesdays at 12 PM and weekday mornings, when your audience is most active.
+    3. **Boost Engagement with CTAs and Interactivity**: Encourage more actions by adding polls, questions, and “comment below” prompts—especially in Reels and Stories.
+    4. **Double Down on Event-Focused Content**: Posts referencing events, parties, or Langston campaigns consistently perform well. Plan content around similar high-interest topics.
+    5. **Optimize Profile for Conversions**: With 266 profile visits in 90 days, make sure your bio and pinned posts encourage visitors to follow and explore further.
+    6. **Refresh Story Strategy**: Stories are underperforming. Try using interactive stickers, countdowns, and behind-the-scenes content to revive engagement.
+    """,
+            ),
+        ],
+    ),
+    "facebook": (
+        "Facebook Performance",
+        [
+            ("subheader", "Which Facebook posts had the highest engagement?"),
+            ("wordcloud", "top_posts"),
+            (
+                "markdown",
+                "Photos generate the highest engagement across all metrics — reactions, comments, and shares. Link posts lag behind in every category. This suggests that focusing on visual storytelling through images is the most effective way to connect with your Facebook audience.",
+            ),
+            ("subheader", "What types of posts are most effective?"),
+            ("chart", "engagement_by_type"),
+            (
+                "markdown",
+                "Photos are the most engaging format, outperforming other types in reactions, comments, and shares. Top-performing posts feature gratitude, celebration, and community-focused content. Engagement peaked on select dates, indicating that event or milestone-based posts resonate strongly.",
+            ),
+            ("subheader", "Summary"),
+            (
+                "markdown",
+                """
+    - **Photos are the most engaging format**, outperforming other types in reactions, comments, and shares
+    - **Top-performing posts** feature gratitude, celebration, and community-focused content
+    - **Engagement peaked on select dates**, indicating that event or milestone-based posts resonate strongly
+    - **Click behavior is moderate**, with most clicks coming from general post interactions, followed by link and photo clicks
+    - **Most posts do not trigger high link click activity**, suggesting CTAs could be stronger
+    """,
+            ),
+            ("subheader", "Recommendations to boost reach and interaction"),
+            (
+                "markdown",
+                """
+    1. **Use More Photo-Based Posts**: Continue prioritizing photos, as they consistently deliver the highest engagement across metrics.
+    2. **Tell Stories That Celebrate People & Moments**: Focus on posts that highlight individuals, gratitude, or achievements. These resonate well with the audience.
+    3. **Include Clear, Visual Call-to-Actions (CTAs)**: To increase clicks and conversions, use buttons, short links, or captions that say exactly what to do (e.g., “Click to register”).
+    4. **Post Around Events or Key Moments**: Engagement spikes around event-related posts. Create content tied to holidays, program launches, or celebrations.
+    5. **Optimize for Interaction, Not Just Awareness**: Use interactive tools (polls, questions) and captions that invite comments or shares, not just views.
+    6. **Review and Repurpose High-Performing Posts**: Identify top posts and reuse their structure or message. Consider boosting them through ads for even greater reach.
+    """,
+            ),
+        ],
+    ),
+    "linkedin": (
+        "LinkedIn Performance",
+        [
+            ("subheader", "How is the growth of the LinkedIn page?"),
+            ("chart", "follower_trend"),
+            (
+                "markdown",
+                "While the follower base is growing, the pace is relatively slow. This suggests that growth is organic and would benefit from more cross-promotion, collaboration tags, and follow prompts across platforms.",
+            ),
+            ("subheader", "What kinds of posts are driving the most engagement?"),
+            ("chart", "engagement_trend"),
+            (
+                "markdown",
+                "There’s a gap between visibility and interaction. To increase engagement, posts need to include clear value, calls to action, and audience-relevant content such as success stories, photos, or event coverage.",
+            ),
+            ("subheader", "What is the demographic profile of our visitors?"),
+            ("chart", "visitor_views"),
+            (
+                "markdown",
+                "Visitors are primarily viewing the Overview section, with minimal interaction on Life or Jobs pages. This suggests an opportunity to refresh and promote these underutilized sections, potentially highlighting team culture, success stories, or available roles.",
+            ),
+            (
+                "subheader",
+                "Are there strategies from competitors we could adopt or improve on?",
+            ),
+            ("chart", "competitors"),
+            (
+                "markdown",
+                "High-engagement competitors post more frequently and use emotionally engaging or mission-driven content. To close the gap, Center for Success can adopt similar strategies like sharing stories, tagging partners, and posting more frequently with a strong visual identity.",
+            ),
+            ("subheader", "Summary"),
+            (
+                "markdown",
+                """
+    - **Engagement & Impressions**: Low and flat engagement despite consistent posting (90 posts in the recent period). Total reach (1,453) and total engagement (140) are disproportionate to posting effort.
+    - **Visitor Behavior**: Visitors primarily view the Overview section. Life and Jobs tabs are underutilized, indicating low interest or awareness.
+    """,
+            ),
+            ("subheader", "Recommendations"),
+            (
+                "markdown",
+                """
+    1. **Post Stories, Not Just Stats**: Share stories about people, milestones, or impact. Use visuals (staff photos, graphics) and keep copy tight and mission-aligned.
+    2. **Repurpose High-Performing Content**: Convert top Facebook/Instagram posts into professional LinkedIn versions.
+    3. **Show the Team & Partners**: Highlight staff, interns, and collaborators — this content performs well across competitors.
+    4. **Promote the Life Section**: Refresh with images, short bios, or testimonials. Link to it in captions and cross-promote from email/newsletters.
+    5. **Increase Posting Frequency**: Aim for 1–2 posts/week minimum. Focus on quality, consistency, and variety of content types.
+    """,
+            ),
+        ],
+    ),
+    "cross_platform": (
+        "Cross-Platform Performance",
+        [
+            ("subheader", "Which platforms are driving the most overall value?"),
+            ("chart", "platform_totals"),
+            (
+                "markdown",
+                "Facebook is currently the strongest channel for reach and engagement. However, Instagram drives more profile traffic with fewer posts, while LinkedIn shows moderate performance and room for growth.",
+            ),
+            ("subheader", "What campaigns worked best across all platforms?"),
+            ("chart", "campaign_presence"),
+            (
+                "markdown",
+                "The most successful campaigns were those that appeared consistently across multiple platforms. Campaigns like Langston Party and March Book Madness performed well on Facebook, Instagram, and Email — suggesting that cross-channel promotion significantly boosts engagement.",
+            ),
+            (
+                "subheader",
+                "Are there months or events with more engagement than others?",
+            ),
+            ("chart", "monthly_engagement"),
+            (
+                "markdown",
+                "Seasonal patterns show that January and March are strong periods for engagement, aligning with EOY fundraising and Book Madness. Planning major campaigns around these months—and mirroring themes across platforms—can significantly increase overall impact.",
+            ),
+            ("subheader", "Summary"),
+            (
+                "markdown",
+                """
+    - **Facebook**: Highest total reach (4,495) and engagement (302) across all platforms
+    - **Instagram**: Best performance in profile visits (266) with fewer posts — strong conversion potential
+    - **LinkedIn**: Moderate impressions and engagement; lowest return per post
+    """,
+            ),
+            ("subheader", "Recommendations"),
+            (
+                "markdown",
+                """
+    1. **Use Instagram for High-Intent Engagement**: Post more Reels and direct followers to your profile link. Prioritize storytelling and action CTAs.
+    2. **Double Down on Facebook for Awareness**: Use photo-based gratitude and event posts; optimize for shares and reactions.
+    3. **Strengthen LinkedIn with Staff & Partner Content**: Post behind-the-scenes, event recaps, and team features. Boost post frequency.
+    4. **Run Campaigns Cross-Platform, Timed to Seasons**: Coordinate messaging in January, March, and late fall.
+    5. **Use Analytics to Repurpose Winning Content**: Turn high-performing Facebook posts into LinkedIn carousels and Email campaigns into Instagram infographics.
+    """,
+            ),
+        ],
+    ),
+}
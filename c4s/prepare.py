@@ -0,0 +1,231 @@
+"""Canonical, analysis-ready frames for each export.
+
+Each preparer takes the raw export as read by ``read_source`` and returns a
+new, typed frame. Pages read these frames and never normalize them again.
+
+The wide Meta exports are read through ``LOAD_COLUMNS`` only, with counts
+as 32-bit integers and post types as categoricals. Their free text is
+loaded separately with ``load_text`` by the features that need it.
+"""
+
+import pandas as pd
+
+from .sources import read_source
+from .timestamps import UNPARSED, normalize_timestamps
+from .trace import span
+
+WEEKDAYS = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+LINKEDIN_ENGAGEMENT_COLS = [
+    "Impressions (total)",
+    "Clicks (total)",
+    "Reactions (total)",
+    "Comments (total)",
+    "Reposts (total)",
+]
+
+# Export columns the pages use; sources not listed load every column
+LOAD_COLUMNS = {
+    "email_clicks": [
+        "Time Sent",
+        "Campaign Name",
+        "Sends",
+        "Opens",
+        "Open Rate",
+        "Clicks",
+        "Click Rate",
+        "Bounces",
+    ],
+    "meta_suite": [
+        "Publish time",
+        "Post type",
+        "Views",
+        "Reach",
+        "Likes",
+        "Shares",
+        "Comments",
+    ],
+    "facebook": [
+        "Publish time",
+        "Post type",
+        "Views",
+        "Reach",
+        "Reactions",
+        "Comments",
+        "Shares",
+        "Total clicks",
+    ],
+}
+
+# Free-text export columns, aligned row for row with the prepared frame
+TEXT_COLUMNS = {
+    "meta_suite": ["Description"],
+    "facebook": ["Title"],
+}
+
+# Prepared timestamp column of each dated source
+TIME_COLUMNS = {
+    "email_clicks": "Time Sent",
+    "meta_suite": "publish_time",
+    "facebook": "publish_time",
+    "linkedin_followers": "Date",
+    "linkedin_activity": "Date",
+    "linkedin_visitors": "Date",
+}
+
+# Insights export column -> length in days of the trailing period it covers
+INSIGHT_PERIODS = {"90 Days Value": 90, "30 Days Value": 30, "14 Days Value": 14}
+
+COMPETITOR_COLS = [
+    "Organization",
+    "Total Followers",
+    "New Followers",
+    "Total Post Engagements",
+    "Total Posts",
+]
+
+
+def _snake_case_columns(df):
+    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+    return df
+
+
+def _promote_header(df):
+    # LinkedIn exports put a description in the first row and the real
+    # header in the second
+    df.columns = df.iloc[0]
+    df = df.drop(index=0).reset_index(drop=True)
+    df.columns.name = None
+    return df
+
+
+def _percent(series):
+    return series.str.replace("%", "").astype(float)
+
+
+def _counts(df, columns):
+    # Missing counts sum like zero; 32 bits leave room for the totals
+    df[columns] = df[columns].fillna(0).astype("int32")
+
+
+def prepare_email_clicks(df):
+    df = df.copy()
+    normalize_timestamps(df, "email_clicks", "Time Sent")
+    _counts(df, ["Sends", "Opens", "Clicks", "Bounces"])
+    df["Open Rate (%)"] = _percent(df["Open Rate"])
+    df["Click Rate (%)"] = _percent(df["Click Rate"])
+    df["Day of Week"] = df["Time Sent"].dt.day_name()
+    return df
+
+
+def prepare_meta_suite(df):
+    df = _snake_case_columns(df.copy())
+    _counts(df, ["views", "reach", "likes", "shares", "comments"])
+    df["post_type"] = df["post_type"].astype("category")
+    normalize_timestamps(df, "meta_suite", "publish_time")
+    df["hour"] = df["publish_time"].dt.hour
+    df["weekday"] = pd.Categorical(
+        df["publish_time"].dt.day_name(), categories=WEEKDAYS, ordered=True
+    )
+    df["Month"] = df["publish_time"].dt.to_period("M")
+    return df
+
+
+def prepare_facebook(df):
+    df = _snake_case_columns(df.copy())
+    _counts(df, ["views", "reach", "reactions", "comments", "shares", "total_clicks"])
+    df["post_type"] = df["post_type"].astype("category")
+    df["total_engagement"] = df["reactions"] + df["comments"] + df["shares"]
+    normalize_timestamps(df, "facebook", "publish_time")
+    df["Month"] = df["publish_time"].dt.to_period("M")
+    return df
+
+
+def prepare_linkedin_followers(df):
+    df = df.copy()
+    df.columns = df.columns.str.strip()
+    normalize_timestamps(df, "linkedin_followers", "Date")
+    df["Total followers"] = pd.to_numeric(df["Total followers"], errors="coerce")
+    return df
+
+
+def prepare_linkedin_activity(df):
+    df = _promote_header(df.copy())
+    df = df.rename(columns={df.columns[0]: "Date"})
+    normalize_timestamps(df, "linkedin_activity", "Date")
+    for col in LINKEDIN_ENGAGEMENT_COLS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["Total Engagement"] = (
+        df["Clicks (total)"]
+        + df["Reactions (total)"]
+        + df["Comments (total)"]
+        + df["Reposts (total)"]
+    )
+    df["Month"] = df["Date"].dt.to_period("M")
+    return df
+
+
+def prepare_linkedin_visitors(df):
+    df = df.copy()
+    normalize_timestamps(df, "linkedin_visitors", "Date")
+    return df
+
+
+def prepare_linkedin_competitors(df):
+    df = _promote_header(df.copy())
+    df = df.rename(columns=dict(zip(df.columns, COMPETITOR_COLS)))
+    for col in COMPETITOR_COLS[1:]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["Engagement per Post"] = df["Total Post Engagements"] / df["Total Posts"]
+    return df
+
+
+def prepare_insta_insights(df):
+    # One row per metric, one column per trailing period in days
+    df = df.drop(columns=[col for col in df.columns if col.startswith("Unnamed")])
+    df["Metric"] = df["Metric"].str.strip()
+    return df.set_index("Metric").rename(columns=INSIGHT_PERIODS)
+
+
+PREPARERS = {
+    "email_clicks": prepare_email_clicks,
+    "meta_suite": prepare_meta_suite,
+    "insta_insights": prepare_insta_insights,
+    "facebook": prepare_facebook,
+    "linkedin_followers": prepare_linkedin_followers,
+    "linkedin_activity": prepare_linkedin_activity,
+    "linkedin_visitors": prepare_linkedin_visitors,
+    "linkedin_competitors": prepare_linkedin_competitors,
+}
+
+
+def load_prepared(name, data_dir="."):
+    """Read one export and return its analysis-ready frame."""
+    with span("load", name) as fields:
+        df = read_source(name, data_dir, LOAD_COLUMNS.get(name))
+        fields["rows"] = len(df)
+    preparer = PREPARERS.get(name)
+    if preparer is None:
+        return df
+    with span("preprocess", name) as fields:
+        df = preparer(df)
+        if UNPARSED in df.attrs:
+            fields["unparsed"] = sum(df.attrs[UNPARSED].values())
+    return df
+
+
+def load_text(name, data_dir="."):
+    """Free-text columns of one export, for the text features only."""
+    with span("load", f"{name} text"):
+        df = _snake_case_columns(read_source(name, data_dir, TEXT_COLUMNS[name]))
+    if "description" in df:
+        df["description"] = df["description"].fillna("")
+    return df
@@ -0,0 +1,260 @@
+"""Static snapshot of every dashboard page for read-only viewers.
+
+    python -m c4s.prerender --out site
+
+Each page is evaluated once per data version, with the same ``c4s.pages``
+layout and ``c4s.specs`` charts as the dashboard, and written as a plain
+HTML page that draws its charts with vega-embed in the browser. Serve
+``<out>/current`` from any file server: viewers cost no Python at all.
+
+The browser scripts are copied into each bundle, so pages load nothing
+from other hosts. They are downloaded once into ``.cache/vendor`` under the
+data directory; on a machine without network access, place them there by
+hand (see ``SCRIPTS``).
+
+A bundle is written to its own ``<out>/<time>-<version>/`` directory and
+published by swapping the ``current`` symlink, so a viewer never sees half
+of one snapshot and half of another. The version covers every source and
+the page text; when neither has changed, nothing is rendered. The previous
+bundle is kept for viewers still loading it and older ones are removed.
+"""
+
+import argparse
+import html
+import json
+import os
+import shutil
+import textwrap
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.request import urlopen
+
+import altair as alt
+
+from . import pages, specs
+from .cache import content_key
+from .dataset import Dataset
+from .sections import SECTION_SOURCES, SECTIONS, top_post_titles
+from .store import replace_file
+from .wordclouds import wordcloud_png
+
+CURRENT = "current"
+VENDOR_DIR = Path(".cache") / "vendor"
+# Bundle directory of the scripts, relative to the pages
+SCRIPTS_DIR = "vendor"
+
+# File name -> download URL of each browser script, in load order
+SCRIPTS = {
+    f"vega-{alt.VEGA_VERSION}.min.js": (
+        f"https://cdn.jsdelivr.net/npm/vega@{alt.VEGA_VERSION}/build/vega.min.js"
+    ),
+    f"vega-lite-{alt.VEGALITE_VERSION}.min.js": (
+        f"https://cdn.jsdelivr.net/npm/vega-lite@{alt.VEGALITE_VERSION}"
+        "/build/vega-lite.min.js"
+    ),
+    f"vega-embed-{alt.VEGAEMBED_VERSION}.min.js": (
+        f"https://cdn.jsdelivr.net/npm/vega-embed@{alt.VEGAEMBED_VERSION}"
+        "/build/vega-embed.min.js"
+    ),
+    "marked-15.min.js": "https://cdn.jsdelivr.net/npm/marked@15/marked.min.js",
+}
+
+STYLE = """
+body { font-family: sans-serif; max-width: 760px; margin: 2rem auto; padding: 0 1rem; }
+nav a { margin-right: 1rem; }
+nav a.active { font-weight: bold; }
+.columns { display: flex; gap: 1rem; }
+img { max-width: 100%; }
+footer { color: #808495; font-size: 0.8rem; margin-top: 3rem; }
+"""
+
+# Markdown as Streamlit renders it, charts from their embedded specs
+SCRIPT = """
+document.querySelectorAll(".markdown").forEach(function (el) {
+  el.innerHTML = marked.parse(el.textContent);
+});
+document.querySelectorAll("script.spec").forEach(function (el) {
+  vegaEmbed("#" + el.dataset.chart, JSON.parse(el.textContent), {actions: false});
+});
+"""
+
+
+def data_version(data_dir="."):
+    """Token of every source and the page text, the snapshot's version."""
+    dataset = Dataset(data_dir)
+    names = sorted({name for names in SECTION_SOURCES.values() for name in names})
+    versions = [(name, dataset.version(name)) for name in names]
+    return content_key(versions, pages.PAGES, list(SCRIPTS))[:16]
+
+
+def vendor_scripts(data_dir="."):
+    """Paths of the local copies of ``SCRIPTS``, downloading missing ones."""
+    vendor_dir = Path(data_dir) / VENDOR_DIR
+    vendor_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, url in SCRIPTS.items():
+        path = vendor_dir / name
+        if not path.exists():
+            try:
+                with urlopen(url, timeout=60) as response:
+                    replace_file(path, lambda fh: shutil.copyfileobj(response, fh))
+            except OSError as exc:
+                raise OSError(
+                    f"could not download {url} ({exc}); save it as {path}"
+                ) from exc
+        paths.append(path)
+    return paths
+
+
+def _page_path(section):
+    return "index.html" if section == next(iter(SECTIONS)) else f"{section}.html"
+
+
+def _chart(chart_id, spec):
+    # "</" would end the script element early
+    payload = json.dumps(spec).replace("</", "<\\/")
+    return (
+        f'<div id="chart-{chart_id}"></div>\n'
+        f'<script type="application/json" class="spec" '
+        f'data-chart="chart-{chart_id}">{payload}</script>'
+    )
+
+
+def render_page(section, figures, images, generated):
+    """HTML of one section's page."""
+    header, blocks = pages.PAGES[section]
+    nav = " ".join(
+        f'<a href="{_page_path(other)}"{" class=active" if other == section else ""}>'
+        f"{html.escape(title)}</a>"
+        for other, (title, _) in SECTIONS.items()
+    )
+    body = [f"<h1>{html.escape(pages.TITLE)}</h1>", f"<nav>{nav}</nav>"]
+    body.append(f"<h2>{html.escape(header)}</h2>")
+    for kind, value in blocks:
+        if kind == "subheader":
+            body.append(f"<h3>{html.escape(value)}</h3>")
+        elif kind == "markdown":
+            text = html.escape(textwrap.dedent(value).strip())
+            body.append(f'<div class="markdown">{text}</div>')
+        elif kind == "chart":
+            body.append(_chart(value, figures[value]))
+        elif kind == "columns":
+            cells = "".join(f"<div>{_chart(c, figures[c])}</div>" for c in value)
+            body.append(f'<div class="columns">{cells}</div>')
+        elif kind == "wordcloud":
+            if value in images:
+                body.append(f'<img src="{images[value]}" alt="Word cloud">')
+            else:
+                body.append("<p>No Facebook posts in the selected date range.</p>")
+    body.append(f"<footer>Snapshot of {generated:%Y-%m-%d %H:%M} UTC</footer>")
+
+    title = f"{SECTIONS[section][0]} | {pages.TITLE}"
+    scripts = "\n".join(
+        f'<script src="{SCRIPTS_DIR}/{name}"></script>' for name in SCRIPTS
+    )
+    return "\n".join(
+        [
+            "<!DOCTYPE html>",
+            '<html lang="en">',
+            "<head>",
+            '<meta charset="utf-8">',
+            f"<title>{html.escape(title)}</title>",
+            f"<style>{STYLE}</style>",
+            scripts,
+            "</head>",
+            "<body>",
+            *body,
+            f"<script>{SCRIPT}</script>",
+            "</body>",
+            "</html>",
+        ]
+    )
+
+
+def write_bundle(dataset, target, generated):
+    """Write every page, its chart specs, images and scripts under ``target``."""
+    (target / SCRIPTS_DIR).mkdir()
+    for path in vendor_scripts(dataset.data_dir):
+        shutil.copyfile(path, target / SCRIPTS_DIR / path.name)
+    all_specs = {}
+    for section, (_, aggregate) in SECTIONS.items():
+        versions = specs.section_versions(dataset, section)
+        aggregates = aggregate(dataset)
+        figures = specs.chart_specs(dataset, section, aggregates, versions)
+        images = {}
+        for kind, value in pages.PAGES[section][1]:
+            if kind == "wordcloud" and not aggregates[value].empty:
+                name = f"{section}_{value}.png"
+                png = wordcloud_png(top_post_titles(aggregates[value]))
+                (target / name).write_bytes(png)
+                images[value] = name
+        page = render_page(section, figures, images, generated)
+        (target / _page_path(section)).write_text(page, encoding="utf-8")
+        all_specs[section] = figures
+    # The same specs for anything that draws the charts itself
+    (target / "specs.json").write_text(json.dumps(all_specs), encoding="utf-8")
+
+
+def _published(out_dir):
+    current = Path(out_dir) / CURRENT
+    return os.readlink(current) if current.is_symlink() else None
+
+
+def publish(out_dir, bundle):
+    """Point ``<out>/current`` at ``bundle`` and drop all but the last two."""
+    out_dir = Path(out_dir)
+    previous = _published(out_dir)
+    link = out_dir / f".{CURRENT}.tmp"
+    link.unlink(missing_ok=True)
+    link.symlink_to(bundle, target_is_directory=True)
+    # Renaming over the old link is atomic, unlike removing and recreating it
+    os.replace(link, out_dir / CURRENT)
+    for path in out_dir.iterdir():
+        if path.is_symlink() or not path.is_dir() or path.name.startswith("."):
+            continue
+        if path.name not in (bundle, previous):
+            shutil.rmtree(path)
+
+
+def prerender(data_dir=".", out_dir="site", force=False):
+    """Render the bundle for the current data, unless it is already current.
+
+    Returns the published bundle's directory.
+    """
+    out_dir = Path(out_dir)
+    version = data_version(data_dir)
+    published = _published(out_dir)
+    if not force and published is not None and published.endswith(f"-{version}"):
+        return out_dir / published
+
+    generated = datetime.now(timezone.utc)
+    bundle = f"{generated:%Y%m%dT%H%M%S}-{version}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dir = out_dir / f".{bundle}.tmp"
+    tmp_dir.mkdir()
+    try:
+        write_bundle(Dataset(data_dir), tmp_dir, generated)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    os.replace(tmp_dir, out_dir / bundle)
+    publish(out_dir, bundle)
+    return out_dir / bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Write a static snapshot of every dashboard page."
+    )
+    parser.add_argument("--data-dir", default=".")
+    parser.add_argument("--out", default="site")
+    parser.add_argument(
+        "--force", action="store_true", help="render even if the data is unchanged"
+    )
+    args = parser.parse_args(argv)
+    target = prerender(args.data_dir, args.out, args.force)
+    print(f"{Path(args.out) / CURRENT} -> {target}")
+
+
+if __name__ == "__main__":
+    main()
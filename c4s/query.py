@@ -0,0 +1,172 @@
+"""Ad-hoc SQL over the prepared exports.
+
+    python -m c4s.query "SELECT post_type, avg(reach) FROM instagram GROUP BY 1"
+
+Each export a query names is written once per version as Parquet: its
+prepared frame and free text, sorted by time, with snake_case column names.
+DuckDB scans those files as Arrow datasets, so it reads only the columns a
+query uses, skips the row groups its filters rule out and aggregates them
+itself instead of in pandas. Results are cached by query text and the
+versions of the tables it reads.
+
+Queries are read-only: one SELECT statement, with no access to files other
+than the registered tables.
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .cache import LRUCache
+from .dataset import Dataset
+from .prepare import TEXT_COLUMNS
+from .store import replace_file
+from .stream import is_streamed, iter_prepared
+
+SQL_DIR = Path(".cache") / "sql"
+ROW_GROUP_ROWS = 64 * 1024
+
+# SQL table name -> source
+TABLES = {
+    "email": "email_clicks",
+    "instagram": "meta_suite",
+    "facebook": "facebook",
+    "linkedin_followers": "linkedin_followers",
+    "linkedin_activity": "linkedin_activity",
+    "linkedin_visitors": "linkedin_visitors",
+    "linkedin_competitors": "linkedin_competitors",
+}
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _column_name(name):
+    name = str(name).strip().lower().replace("%", "pct")
+    return re.sub(r"[^0-9a-z]+", "_", name).strip("_")
+
+
+def normalize(frame):
+    """``frame`` with SQL-friendly column names and types."""
+    frame = frame.copy(deep=False)
+    for col in frame.columns:
+        if isinstance(frame[col].dtype, pd.PeriodDtype):
+            frame[col] = frame[col].dt.start_time
+    frame.columns = [_column_name(col) for col in frame.columns]
+    return frame
+
+
+def _time_column(frame):
+    times = frame.select_dtypes("datetime").columns
+    return times[0] if len(times) else None
+
+
+def referenced_tables(sql):
+    words = set(re.findall(r"\w+", sql.lower()))
+    return [table for table in TABLES if table in words]
+
+
+class QueryEngine:
+    """Runs read-only SQL over the tables of a ``Dataset``."""
+
+    def __init__(self, dataset, cache_size=64):
+        self.dataset = dataset
+        self._results = LRUCache(maxsize=cache_size)
+
+    def _frames(self, name):
+        if is_streamed(name, self.dataset.data_dir):
+            yield from iter_prepared(name, self.dataset.data_dir, text=True)
+            return
+        frame = self.dataset.frame(name)
+        if name in TEXT_COLUMNS:
+            frame = frame.join(self.dataset.text(name))
+        column = _time_column(frame)
+        # Time-ordered row groups let date filters skip most of the file
+        yield frame if column is None else frame.sort_values(column, kind="stable")
+
+    def _write(self, table):
+        name = TABLES[table]
+        path = Path(self.dataset.data_dir) / SQL_DIR / f"{table}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        def write(fh):
+            writer = None
+            try:
+                # Streamed exports are written chunk by chunk
+                for frame in self._frames(name):
+                    frame = normalize(frame)
+                    if writer is None:
+                        schema = pa.Schema.from_pandas(frame, preserve_index=False)
+                        writer = pq.ParquetWriter(fh, schema)
+                    batch = pa.Table.from_pandas(frame, schema, preserve_index=False)
+                    writer.write_table(batch, row_group_size=ROW_GROUP_ROWS)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        # The page and the command line may write the same table at once
+        replace_file(path, write)
+        return path
+
+    def table_path(self, table):
+        """Parquet file of ``table``, rewritten when its source changes."""
+        return self.dataset.cached(
+            f"sql.{table}", lambda: self._write(table), TABLES[table]
+        )
+
+    def schema(self, table):
+        return pq.read_schema(self.table_path(table))
+
+    def query(self, sql):
+        """Result of one SELECT statement as a frame; callers must not modify it."""
+        sql = sql.strip().rstrip(";").strip()
+        try:
+            statements = duckdb.extract_statements(sql)
+        except duckdb.Error as exc:
+            raise QueryError(str(exc)) from exc
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise QueryError("only a single SELECT statement can be run")
+
+        tables = referenced_tables(sql)
+        key = (
+            sql,
+            tuple((table, self.dataset.version(TABLES[table])) for table in tables),
+        )
+        return self._results.get_or_create(key, lambda: self._run(sql, tables))
+
+    def _run(self, sql, tables):
+        # A connection per query: DuckDB connections are not shared across
+        # threads, and opening one in memory takes well under a millisecond
+        with duckdb.connect() as con:
+            for table in tables:
+                con.register(table, ds.dataset(self.table_path(table)))
+            con.execute("SET enable_external_access = false")
+            con.execute("SET lock_configuration = true")
+            try:
+                return con.sql(sql).df()
+            except duckdb.Error as exc:
+                raise QueryError(str(exc)) from exc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run SQL over the exports.")
+    parser.add_argument("sql")
+    parser.add_argument("--data-dir", default=".")
+    args = parser.parse_args(argv)
+    engine = QueryEngine(Dataset(args.data_dir))
+    try:
+        result = engine.query(args.sql)
+    except QueryError as exc:
+        parser.exit(1, f"{exc}\n")
+    print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Headless batch report of every dashboard section.
+
+    python -m c4s.report --out reports data/org-a data/org-b
+
+Each (organization, section) pair runs in a worker process with the same
+``c4s.sections`` and ``c4s.charts`` code as the dashboard. Aggregates are
+written as JSON or Parquet and each chart as a standalone HTML page under
+``<out>/<organization>/<section>/``.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from . import charts
+from .dataset import Dataset
+from .sections import SECTIONS, top_post_titles
+from .wordclouds import wordcloud_png
+
+# One dataset per data directory and worker, shared by the sections it runs
+_DATASETS = {}
+
+
+def _dataset(data_dir):
+    if data_dir not in _DATASETS:
+        _DATASETS[data_dir] = Dataset(data_dir)
+    return _DATASETS[data_dir]
+
+
+def write_aggregate(frame, path_stem, fmt):
+    if fmt == "parquet":
+        path = path_stem.with_suffix(".parquet")
+        frame.to_parquet(path, index=False)
+    else:
+        path = path_stem.with_suffix(".json")
+        frame.to_json(path, orient="records", date_format="iso", indent=1)
+    return path
+
+
+def run_section(data_dir, section, out_dir, fmt="json"):
+    """Compute one section for one data directory and write its outputs."""
+    started = time.perf_counter()
+    aggregates = SECTIONS[section][1](_dataset(data_dir))
+    target = Path(out_dir) / section
+    target.mkdir(parents=True, exist_ok=True)
+
+    written = [
+        write_aggregate(frame, target / name, fmt) for name, frame in aggregates.items()
+    ]
+    for chart_id, chart in charts.build_charts(section, aggregates).items():
+        path = target / f"{chart_id}.html"
+        chart.save(str(path))
+        written.append(path)
+    if section == "facebook":
+        path = target / "top_posts_wordcloud.png"
+        path.write_bytes(wordcloud_png(top_post_titles(aggregates["top_posts"])))
+        written.append(path)
+    return section, data_dir, time.perf_counter() - started, written
+
+
+def organization(data_dir):
+    return Path(data_dir).resolve().name
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compute every dashboard section without a browser."
+    )
+    parser.add_argument("data_dirs", nargs="*", default=["."])
+    parser.add_argument("--out", default="reports")
+    parser.add_argument("--format", choices=["json", "parquet"], default="json")
+    parser.add_argument(
+        "--section", dest="sections", action="append", choices=list(SECTIONS)
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    jobs = [
+        (data_dir, section, Path(args.out) / organization(data_dir), args.format)
+        for data_dir in args.data_dirs
+        for section in args.sections or SECTIONS
+    ]
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(run_section, *job): job for job in jobs}
+        for future in as_completed(futures):
+            data_dir, section = futures[future][:2]
+            try:
+                _, _, elapsed, written = future.result()
+            except Exception as exc:  # report every failure, keep the rest
+                failed += 1
+                print(f"{organization(data_dir)}/{section}: failed: {exc!r}")
+                continue
+            print(
+                f"{organization(data_dir)}/{section}: "
+                f"{len(written)} files in {elapsed:.2f}s"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,385 @@
+"""Aggregates behind each dashboard section.
+
+Each section function takes a ``Dataset`` and an optional date window (see
+``c4s.window``) and returns ``{name: DataFrame}``.
+The dashboard renders them with the builders in ``c4s.charts`` and
+``python -m c4s.report`` writes the same frames out without a browser.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import campaigns
+from .cube import load_cube, per_post, rollup, weighted_rate
+from .kpis import kpi_table
+from .prepare import TEXT_COLUMNS, TIME_COLUMNS, WEEKDAYS
+from .spikes import engagement_spikes
+from .stream import is_streamed, iter_prepared, theme_stats, top_rows
+from .themes import ThemeTagger
+from .window import sort_by_time, time_slice
+
+INSTAGRAM_KEYWORDS = [
+    "book",
+    "madness",
+    "eoy",
+    "party",
+    "langston",
+    "march",
+    "event",
+    "read",
+    "donate",
+    "celebrate",
+    "invited",
+    "register",
+]
+
+THEME_METRICS = ["reach", "likes", "comments", "shares", "views"]
+
+# Platform -> (source, text column, engagement) of the posts matched into
+# campaigns; an email's engagement is its clicks
+CAMPAIGN_SOURCES = {
+    "Facebook": ("facebook", "title", lambda df: df["total_engagement"]),
+    "Instagram": (
+        "meta_suite",
+        "description",
+        lambda df: df["likes"] + df["comments"] + df["shares"],
+    ),
+    "Email": ("email_clicks", "Campaign Name", lambda df: df["Clicks"]),
+}
+
+# Campaigns shown in the cross-platform heatmap; a post shared to both
+# Meta platforms alone is not a campaign
+MAX_CAMPAIGNS = 8
+MIN_CAMPAIGN_POSTS = 3
+
+
+def email(dataset, window=None):
+    email_clicks = dataset.frame("email_clicks", window)
+    email_cube = load_cube(dataset, "Email", window=window)
+
+    # Open and Click Rate by Day, weighted by delivered sends
+    by_day = rollup(email_cube, ["weekday"]).set_index("weekday")
+    delivered = by_day["sends"] - by_day["bounces"]
+    dow_summary = pd.DataFrame(
+        {
+            "Open Rate (%)": weighted_rate(by_day["opens"], delivered),
+            "Click Rate (%)": weighted_rate(by_day["clicks"], delivered),
+        }
+    ).reindex(WEEKDAYS)
+    dow_summary.index.name = "Day of Week"
+    dow_reset = dow_summary.reset_index().melt(
+        id_vars="Day of Week", var_name="Rate Type", value_name="Rate"
+    )
+
+    # Time trend
+    line_data = email_clicks[["Time Sent", "Open Rate (%)", "Click Rate (%)"]].melt(
+        id_vars="Time Sent", var_name="Rate Type", value_name="Rate"
+    )
+
+    # Top campaigns
+    top_open = email_clicks.sort_values(by="Open Rate (%)", ascending=False)[
+        ["Campaign Name", "Open Rate (%)"]
+    ].head(10)
+    top_click = email_clicks.sort_values(by="Click Rate (%)", ascending=False)[
+        ["Campaign Name", "Click Rate (%)"]
+    ].head(10)
+
+    return {
+        "rates_by_weekday": dow_reset,
+        "rates_over_time": line_data,
+        "engagement_spikes": engagement_spikes(dataset, ["Email"], window),
+        "top_open": top_open,
+        "top_click": top_click,
+    }
+
+
+def _theme_stats(dataset, window=None):
+    tagger = ThemeTagger(INSTAGRAM_KEYWORDS)
+    if is_streamed("meta_suite", dataset.data_dir):
+        return dataset.cached(
+            "meta_suite.theme_stats",
+            lambda: theme_stats(
+                "meta_suite",
+                dataset.data_dir,
+                tagger,
+                "description",
+                THEME_METRICS,
+                window,
+            ),
+            "meta_suite",
+            window=window,
+        )
+
+    def stats():
+        posts = dataset.frame("meta_suite", window)
+        texts = dataset.text("meta_suite")["description"]
+        if window is not None:
+            texts = texts.loc[posts.index]
+        return tagger.stats(texts, posts[THEME_METRICS])
+
+    return dataset.cached("meta_suite.theme_stats", stats, "meta_suite", window=window)
+
+
+def instagram(dataset, window=None):
+    instagram_cube = load_cube(dataset, "Instagram", window=window)
+
+    by_type = rollup(instagram_cube, ["post_type"])
+    type_perf = (
+        by_type[["post_type"]]
+        .join(per_post(by_type, ["reach", "likes", "comments", "shares", "views"]))
+        .sort_values(by="reach", ascending=False)
+        .reset_index(drop=True)
+    )
+
+    by_slot = rollup(instagram_cube, ["weekday", "hour"], ["reach", "posts"])
+    heatmap_data = by_slot[["weekday", "hour"]].assign(
+        reach=per_post(by_slot, ["reach"])["reach"]
+    )
+
+    reach_by_theme = (
+        _theme_stats(dataset, window)
+        .sort_values(by="reach", ascending=False)
+        .reset_index(drop=True)
+    )
+
+    return {
+        "reach_by_type": type_perf,
+        "reach_by_slot": heatmap_data,
+        "reach_by_theme": reach_by_theme,
+    }
+
+
+def _top_facebook_posts(dataset, window=None, n=10):
+    columns = [
+        "title",
+        "post_type",
+        "reactions",
+        "comments",
+        "shares",
+        "total_engagement",
+    ]
+    if is_streamed("facebook", dataset.data_dir):
+        return dataset.cached(
+            "facebook.top_posts",
+            lambda: top_rows(
+                iter_prepared("facebook", dataset.data_dir, text=True, window=window),
+                "total_engagement",
+                n,
+                columns,
+            ),
+            "facebook",
+            window=window,
+        )
+    fb_df = dataset.frame("facebook", window)
+    top = fb_df.sort_values(by="total_engagement", ascending=False)[columns[1:]].head(n)
+    # Titles are only loaded for the posts that are shown
+    top.insert(0, "title", dataset.text("facebook")["title"].loc[top.index])
+    return top
+
+
+def facebook(dataset, window=None):
+    top_engaged_posts = _top_facebook_posts(dataset, window)
+
+    by_type = rollup(load_cube(dataset, "Facebook", window=window), ["post_type"])
+    type_summary = by_type[["post_type"]].join(
+        per_post(by_type, ["likes", "comments", "shares"]).rename(
+            columns={"likes": "reactions"}
+        )
+    )
+    type_summary_melted = type_summary.melt(
+        id_vars="post_type", var_name="Metric", value_name="Average"
+    )
+
+    return {
+        "top_posts": top_engaged_posts,
+        "engagement_by_type": type_summary_melted,
+    }
+
+
+def top_post_titles(top_posts):
+    """Text of the top posts, as fed to the word cloud."""
+    return " ".join(top_posts["title"].astype(str))
+
+
+def linkedin(dataset, window=None):
+    followers_df = dataset.frame("linkedin_followers", window)
+    activity_df = dataset.frame("linkedin_activity", window)
+    visitors_df = dataset.frame("linkedin_visitors", window)
+    competitors_df = dataset.frame("linkedin_competitors")
+
+    follower_trend = followers_df[["Date", "Total followers"]].dropna()
+
+    impressions_line = activity_df[["Date", "Impressions (total)"]].rename(
+        columns={"Impressions (total)": "Value"}
+    )
+    engagement_line = activity_df[["Date", "Total Engagement"]].rename(
+        columns={"Total Engagement": "Value"}
+    )
+    combined = pd.concat(
+        [
+            impressions_line.assign(Metric="Impressions"),
+            engagement_line.assign(Metric="Engagement"),
+        ]
+    )
+
+    visitor_summary = visitors_df[
+        [
+            "Date",
+            "Overview page views (total)",
+            "Life page views (total)",
+            "Jobs page views (total)",
+        ]
+    ].dropna()
+    visitor_melted = visitor_summary.melt(
+        id_vars="Date", var_name="Page Section", value_name="Views"
+    )
+
+    return {
+        "follower_trend": follower_trend,
+        "engagement_trend": combined,
+        "engagement_spikes": engagement_spikes(dataset, ["LinkedIn"], window),
+        "visitor_views": visitor_melted,
+        "competitors": competitors_df,
+    }
+
+
+def _campaign_chunks(dataset, platform):
+    name, text, engagement = CAMPAIGN_SOURCES[platform]
+    if is_streamed(name, dataset.data_dir):
+        chunks = iter_prepared(name, dataset.data_dir, text=True)
+    elif name in TEXT_COLUMNS:
+        chunks = [dataset.frame(name).join(dataset.text(name))]
+    else:
+        chunks = [dataset.frame(name)]
+    for df in chunks:
+        # Case and spacing make no difference to the match
+        texts = df[text].fillna("").astype(str).str.lower().str.split().str.join(" ")
+        yield pd.DataFrame(
+            {
+                "platform": platform,
+                "time": df[TIME_COLUMNS[name]],
+                "text": texts,
+                "engagement": engagement(df),
+            }
+        )
+
+
+def campaign_posts(dataset):
+    """Every post and email with its matched campaign, sorted by time.
+
+    Posts with the same platform, time and text are matched once. Each
+    chunk is reduced to those distinct posts as it is read, so a streamed
+    export's text is held once per distinct post rather than once per row.
+    """
+
+    def match():
+        posts, distinct = [], None
+        for platform in CAMPAIGN_SOURCES:
+            for chunk in _campaign_chunks(dataset, platform):
+                keys = pd.util.hash_pandas_object(
+                    chunk[["platform", "time", "text"]], index=False
+                )
+                chunk = chunk.assign(key=keys.to_numpy())
+                new = chunk[["key", "time", "text"]].drop_duplicates("key")
+                if distinct is not None:
+                    new = pd.concat([distinct, new]).drop_duplicates("key")
+                distinct = new.reset_index(drop=True)
+                posts.append(chunk.drop(columns="text"))
+        matched = campaigns.match(distinct).set_axis(distinct["key"])
+        posts = pd.concat(posts, ignore_index=True)
+        posts["campaign"] = matched.reindex(posts.pop("key")).to_numpy()
+        return sort_by_time(posts, "time")
+
+    sources = [name for name, _, _ in CAMPAIGN_SOURCES.values()]
+    return dataset.cached("campaign_posts", match, *sources)
+
+
+def _campaigns(dataset, window=None):
+    posts = time_slice(campaign_posts(dataset), "time", window)
+    by_platform = posts.groupby(["campaign", "platform"]).agg(
+        Posts=("time", "size"), Engagement=("engagement", "sum")
+    )
+    totals = by_platform.groupby(level="campaign").agg(
+        Platforms=("Posts", "size"),
+        Posts=("Posts", "sum"),
+        Engagement=("Engagement", "sum"),
+    )
+    # Campaigns of several posts on more than one platform, widest first
+    shown = (
+        totals[(totals["Platforms"] > 1) & (totals["Posts"] >= MIN_CAMPAIGN_POSTS)]
+        .sort_values(["Platforms", "Engagement"], ascending=False, kind="stable")
+        .head(MAX_CAMPAIGNS)
+    )
+    grid = pd.MultiIndex.from_product(
+        [shown.index, list(CAMPAIGN_SOURCES)], names=["campaign", "platform"]
+    )
+    presence = by_platform.reindex(grid, fill_value=0).reset_index()
+    presence.insert(2, "Presence", np.where(presence["Posts"] > 0, "✅", ""))
+    presence = presence.rename(
+        columns={"campaign": "Campaign/Theme", "platform": "Platform"}
+    )
+    shown = shown.reset_index().rename(columns={"campaign": "Campaign/Theme"})
+    return presence, shown
+
+
+def cross_platform(dataset, window=None):
+    platform_df = kpi_table(dataset, window)
+    melted_platform = platform_df.melt(
+        id_vars="Platform",
+        value_vars=["Reach", "Engagements", "Profile Visits"],
+        var_name="Metric",
+        value_name="Value",
+    ).dropna()
+
+    campaign_presence, campaign_totals = _campaigns(dataset, window)
+    platform_cube = load_cube(
+        dataset, "Facebook", "Instagram", "LinkedIn", window=window
+    )
+
+    combined_monthly = rollup(platform_cube, ["month", "platform"], ["engagement"])
+    combined_monthly = combined_monthly.rename(
+        columns={"month": "Month", "platform": "Platform", "engagement": "Engagement"}
+    )
+    combined_monthly["Month"] = combined_monthly["Month"].astype(str)
+
+    return {
+        "platform_totals": melted_platform,
+        "platform_kpis": platform_df,
+        "campaign_presence": campaign_presence,
+        "campaign_totals": campaign_totals,
+        "monthly_engagement": combined_monthly,
+        "engagement_spikes": engagement_spikes(
+            dataset, ["Facebook", "Instagram", "LinkedIn"], window
+        ),
+    }
+
+
+# Section id -> sources it reads
+SECTION_SOURCES = {
+    "email": ["email_clicks"],
+    "instagram": ["meta_suite"],
+    "facebook": ["facebook"],
+    "linkedin": [
+        "linkedin_followers",
+        "linkedin_activity",
+        "linkedin_visitors",
+        "linkedin_competitors",
+    ],
+    "cross_platform": [
+        "email_clicks",
+        "facebook",
+        "meta_suite",
+        "insta_insights",
+        "linkedin_activity",
+        "linkedin_visitors",
+    ],
+}
+
+# Section id -> (page title, aggregates)
+SECTIONS = {
+    "email": ("Email Marketing", email),
+    "instagram": ("Instagram", instagram),
+    "facebook": ("Facebook", facebook),
+    "linkedin": ("LinkedIn", linkedin),
+    "cross_platform": ("Cross-Platform Overview", cross_platform),
+}
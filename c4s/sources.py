@@ -0,0 +1,148 @@
+"""Exported data sources and their columnar on-disk cache.
+
+The platform exports are read once through pandas (openpyxl for the xlsx
+files) and written next to the data as Parquet. Later reads come from the
+Parquet copy until the export's mtime, size or content hash changes.
+
+Once a source has been ingested with ``python -m c4s.ingest`` it is served
+from the persistent store instead of its single export file.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from .store import has_table, read_table, replace_file, table_version, to_columnar
+
+CACHE_DIR = Path(".cache") / "columnar"
+
+# Source name -> export file, as downloaded from each platform
+SOURCES = {
+    "email_clicks": "email_clicks.csv",
+    "email_overview": "email_overview.csv",
+    "meta_suite": "Instagram_meta_business_suite.xlsx",
+    "insta_insights": "Final_Instagram_Insights_Data.xlsx",
+    "facebook": "facebook_published.csv",
+    "linkedin_followers": "Linkedin_followers.xlsx",
+    "linkedin_visitors": "linkedin_visitors.xlsx",
+    "linkedin_activity": "LinkedIn.xlsx",
+    "linkedin_competitors": "competitors_linkedin.xlsx",
+}
+
+
+def source_path(name, data_dir="."):
+    return Path(data_dir) / SOURCES[name]
+
+
+def source_version(name, data_dir="."):
+    """Cheap per-rerun change token for one source."""
+    if has_table(name, data_dir):
+        return ("store",) + table_version(name, data_dir)
+    stat = source_path(name, data_dir).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_export(path):
+    path = Path(path)
+    if path.suffix == ".csv":
+        return pd.read_csv(path)
+    return pd.read_excel(path)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(path):
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(df, parquet_path, manifest_path, manifest):
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    replace_file(parquet_path, df.to_parquet)
+    _write_manifest(manifest_path, manifest)
+
+
+def _write_manifest(path, manifest):
+    replace_file(path, lambda fh: fh.write(json.dumps(manifest).encode()))
+
+
+def _cache_paths(name, data_dir):
+    cache_dir = Path(data_dir) / CACHE_DIR
+    return cache_dir / f"{name}.parquet", cache_dir / f"{name}.json"
+
+
+def is_cached(name, data_dir="."):
+    """Whether ``read_source`` can serve ``name`` without parsing its export."""
+    if has_table(name, data_dir):
+        return True
+    parquet_path, manifest_path = _cache_paths(name, data_dir)
+    manifest = _read_manifest(manifest_path)
+    stat = source_path(name, data_dir).stat()
+    return (
+        manifest is not None
+        and parquet_path.exists()
+        and manifest.get("mtime_ns") == stat.st_mtime_ns
+        and manifest.get("size") == stat.st_size
+    )
+
+
+def build_cache(name, data_dir="."):
+    """Parse ``name`` into the columnar cache, e.g. in a worker process."""
+    # No columns: nothing to send back to the caller
+    read_source(name, data_dir, columns=[])
+
+
+def read_source(name, data_dir=".", columns=None):
+    """Read one source from the store, or its export via the columnar cache.
+
+    ``columns`` limits the read to those export columns; the cache itself
+    always holds the whole export.
+    """
+    if has_table(name, data_dir):
+        stored = read_table(name, data_dir, columns)
+        # Drop the ingest bookkeeping columns such as _exported_at
+        return stored.drop(columns=[c for c in stored.columns if c.startswith("_")])
+
+    path = source_path(name, data_dir)
+    parquet_path, manifest_path = _cache_paths(name, data_dir)
+
+    stat = path.stat()
+    manifest = _read_manifest(manifest_path)
+    fresh = {"source": path.name, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    if manifest is not None and parquet_path.exists():
+        if (
+            manifest.get("mtime_ns") == stat.st_mtime_ns
+            and manifest.get("size") == stat.st_size
+        ):
+            return pd.read_parquet(parquet_path, columns=columns)
+        # Touched or copied but possibly unchanged: only a new hash rebuilds
+        fresh["sha256"] = file_digest(path)
+        if manifest.get("sha256") == fresh["sha256"]:
+            try:
+                _write_manifest(manifest_path, fresh)
+            except OSError:
+                pass
+            return pd.read_parquet(parquet_path, columns=columns)
+    else:
+        fresh["sha256"] = file_digest(path)
+
+    df = to_columnar(read_export(path))
+    try:
+        _write_cache(df, parquet_path, manifest_path, fresh)
+    except OSError:
+        # Read-only data directory: serve the parsed frame uncached
+        return df if columns is None else df[columns]
+    # Read back so cold and warm loads hand out identical dtypes
+    return pd.read_parquet(parquet_path, columns=columns)
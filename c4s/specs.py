@@ -0,0 +1,63 @@
+"""Vega-Lite specs of the dashboard's charts, built once per data version.
+
+Building the Altair charts and serializing them with ``to_dict`` takes as
+long as the aggregates behind them, so the final specs are cached and
+shared by every session. A spec is keyed by its section and chart, the
+versions of the section's sources taken before its aggregates were
+computed, the date window and the chart's own zoom window, and carries its
+data as a named entry of the top-level ``datasets`` rather than inline, the
+same shape ``st.altair_chart`` would produce.
+"""
+
+import threading
+
+import altair as alt
+
+from .cache import LRUCache
+from .charts import CHARTS
+from .sections import SECTION_SOURCES
+
+_SPEC_CACHE = LRUCache(maxsize=256)
+# Altair's theme is global to every thread
+_THEME_LOCK = threading.Lock()
+
+
+def to_spec(chart):
+    """Vega-Lite dict of ``chart``, its data moved to named datasets.
+
+    Like ``st.altair_chart``, the spec leaves out the default theme's chart
+    size so that Streamlit's own sizing applies.
+    """
+    with _THEME_LOCK, alt.theme.enable("none"):
+        return chart.to_dict()
+
+
+def section_versions(dataset, section):
+    """Versions of ``section``'s sources, to take before its aggregates."""
+    return tuple(dataset.version(name) for name in SECTION_SOURCES[section])
+
+
+def chart_spec(dataset, section, chart_id, build, versions, window=None, zoom=None):
+    """Spec of one chart of ``section``, calling ``build()`` on a miss.
+
+    ``build`` returns that chart alone, for ``window`` and zoomed to
+    ``zoom``, from aggregates computed at ``versions``. The spec is shared;
+    callers must not modify it.
+    """
+    key = (str(dataset.data_dir), section, chart_id, versions, window, zoom)
+    return _SPEC_CACHE.get_or_create(key, lambda: to_spec(build()))
+
+
+def chart_specs(dataset, section, aggregates, versions, window=None):
+    """``{chart_id: spec}`` of every chart of ``section``, unzoomed."""
+    return {
+        chart_id: chart_spec(
+            dataset,
+            section,
+            chart_id,
+            lambda build=build: build(aggregates),
+            versions,
+            window,
+        )
+        for chart_id, build in CHARTS[section].items()
+    }
@@ -0,0 +1,119 @@
+"""Engagement spikes in each platform's daily series.
+
+A day is a spike when its engagement stands out from the days before it: a
+robust z-score of at least ``THRESHOLD``, measured against the median of the
+previous ``HISTORY`` active days and scaled by their median absolute
+deviation (MAD). Medians are not dragged up by earlier spikes the way a
+mean and standard deviation are, so one viral post does not hide the next.
+
+All days are scored at once over sliding windows. A day's score depends on
+the days before it only, so when an export gains new days the scores of the
+unchanged days are reused and only the rest are computed again.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .cache import LRUCache
+from .cube import PLATFORMS, load_cube, rollup
+from .window import in_window
+
+HISTORY = 28
+MIN_HISTORY = 7
+THRESHOLD = 3.5
+# Scales a MAD to the standard deviation of normally distributed data
+MAD_SCALE = 0.6745
+# A flat history would make every busier day a spike
+MIN_MAD = 1.0
+
+# Platform -> cube measure of its engagement; an email's engagement is its
+# clicks
+ENGAGEMENT = {
+    "Email": "clicks",
+    "Instagram": "engagement",
+    "Facebook": "engagement",
+    "LinkedIn": "engagement",
+}
+
+COLUMNS = ["Date", "Platform", "Engagement", "Baseline", "Score"]
+
+# (data directory, platform) -> last scored series, for incremental updates
+_SCORED = LRUCache(maxsize=32)
+
+
+def daily_engagement(dataset, platform):
+    """``Date`` and ``Engagement`` of each day ``platform`` was active."""
+    daily = rollup(load_cube(dataset, platform), ["date"], [ENGAGEMENT[platform]])
+    daily.columns = ["Date", "Engagement"]
+    return daily
+
+
+def robust_scores(values, start=0):
+    """Trailing median and robust z-score of each of ``values[start:]``.
+
+    Days with fewer than ``MIN_HISTORY`` days before them have no score.
+    """
+    values = np.asarray(values, dtype=float)
+    if start >= len(values):
+        return np.array([]), np.array([])
+    # Row i of the windows holds the HISTORY values before values[i],
+    # padded with NaN at the start of the series
+    padded = np.concatenate([np.full(HISTORY, np.nan), values[:-1]])
+    windows = sliding_window_view(padded, HISTORY)[start:]
+    enough = (~np.isnan(windows)).sum(axis=1) >= MIN_HISTORY
+    baseline = np.full(len(windows), np.nan)
+    mad = np.full(len(windows), np.nan)
+    baseline[enough] = np.nanmedian(windows[enough], axis=1)
+    deviations = np.abs(windows[enough] - baseline[enough, None])
+    mad[enough] = np.nanmedian(deviations, axis=1)
+    scores = MAD_SCALE * (values[start:] - baseline) / np.maximum(mad, MIN_MAD)
+    return baseline, scores
+
+
+def score(daily, previous=None):
+    """``daily`` with each day's ``Baseline`` and ``Score``.
+
+    Days that ``previous``, an earlier result, scored over the same history
+    keep their scores.
+    """
+    start = 0
+    if previous is not None:
+        n = min(len(previous), len(daily))
+        same = (previous["Date"].to_numpy()[:n] == daily["Date"].to_numpy()[:n]) & (
+            previous["Engagement"].to_numpy()[:n] == daily["Engagement"].to_numpy()[:n]
+        )
+        start = n if same.all() else int(np.argmin(same))
+    baseline, scores = robust_scores(daily["Engagement"], start)
+    if start:
+        baseline = np.concatenate([previous["Baseline"].to_numpy()[:start], baseline])
+        scores = np.concatenate([previous["Score"].to_numpy()[:start], scores])
+    return daily.assign(Baseline=baseline, Score=scores)
+
+
+def platform_spikes(dataset, platform, window=None):
+    """Spike days of ``platform``, detected over its whole history.
+
+    With a date ``window`` only the spikes within it are returned; their
+    baselines still come from the days before, inside the window or not.
+    """
+    key = (str(dataset.data_dir), platform)
+
+    def detect():
+        scored = score(daily_engagement(dataset, platform), _SCORED.get(key))
+        _SCORED.put(key, scored)
+        found = scored[scored["Score"] >= THRESHOLD].assign(Platform=platform)
+        return found[COLUMNS].reset_index(drop=True)
+
+    found = dataset.cached(f"spikes.{platform}", detect, PLATFORMS[platform][0])
+    if window is not None:
+        found = found[in_window(found, "Date", window)]
+    return found
+
+
+def engagement_spikes(dataset, platforms, window=None):
+    """``platform_spikes`` of several platforms in one frame."""
+    return pd.concat(
+        [platform_spikes(dataset, platform, window) for platform in platforms],
+        ignore_index=True,
+    )
@@ -0,0 +1,148 @@
+"""Persistent, month-partitioned Parquet tables under ``store/``.
+
+Ingested exports and their cube cells live here as one Parquet file per
+month, so adding a month of data only rewrites the months it touches. Each
+table keeps a manifest whose stat is the table's version.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STORE_DIR = Path("store")
+MANIFEST = "_manifest.json"
+LOCK = "_lock"
+UNDATED = "undated"
+
+
+def to_columnar(df):
+    # Parquet wants string column names and a single type per column. The
+    # LinkedIn exports keep their real header in the first data row, so
+    # those columns mix text with numbers; store them as text and let the
+    # preparers coerce them.
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        if len({type(value) for value in df[col].dropna()}) > 1:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def replace_file(path, write):
+    """Write ``path`` through ``write(fh)`` on a temporary file, then rename.
+
+    Each writer has its own temporary file, so concurrent writers of the
+    same file (threads, worker processes, other sessions) never write into
+    each other's half-written file.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as fh:
+        tmp_path = Path(fh.name)
+        try:
+            write(fh)
+        except BaseException:
+            fh.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def table_dir(table, data_dir="."):
+    return Path(data_dir) / STORE_DIR / table
+
+
+@contextmanager
+def table_lock(table, data_dir="."):
+    """Hold an exclusive lock on ``table`` while reading and rewriting it.
+
+    Readers need no lock; writers that merge into existing partitions do,
+    or two of them would each rewrite the old partitions without the
+    other's rows.
+    """
+    directory = table_dir(table, data_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK, "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def has_table(table, data_dir="."):
+    return (table_dir(table, data_dir) / MANIFEST).exists()
+
+
+def table_version(table, data_dir="."):
+    stat = (table_dir(table, data_dir) / MANIFEST).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_manifest(table, data_dir="."):
+    with open(table_dir(table, data_dir) / MANIFEST) as fh:
+        return json.load(fh)
+
+
+def _partition_path(table, partition, data_dir):
+    return table_dir(table, data_dir) / f"month={partition}.parquet"
+
+
+def read_partition(table, partition, data_dir=".", columns=None):
+    path = _partition_path(table, partition, data_dir)
+    return pd.read_parquet(path, columns=columns) if path.exists() else None
+
+
+def read_table(table, data_dir=".", columns=None):
+    partitions = read_manifest(table, data_dir)["partitions"]
+    frames = [
+        read_partition(table, partition, data_dir, columns) for partition in partitions
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_partitions(table, frames, data_dir="."):
+    """Replace the given ``{partition: frame}`` and bump the manifest."""
+    directory = table_dir(table, data_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    for partition, frame in frames.items():
+        path = _partition_path(table, partition, data_dir)
+        columnar = to_columnar(frame)
+        replace_file(path, lambda fh: columnar.to_parquet(fh, index=False))
+
+    manifest = read_manifest(table, data_dir) if has_table(table, data_dir) else {}
+    manifest = {
+        "partitions": sorted(set(manifest.get("partitions", [])) | set(frames)),
+        "revision": manifest.get("revision", 0) + 1,
+        "updated": datetime.now(timezone.utc).isoformat(),
+    }
+    # Readers key on the manifest, so they switch over only once every
+    # partition above is in place
+    replace_file(
+        directory / MANIFEST, lambda fh: fh.write(json.dumps(manifest).encode())
+    )
+    return manifest
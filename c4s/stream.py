@@ -0,0 +1,111 @@
+"""Bounded-memory aggregates over exports too large to load whole.
+
+A full-history Meta export can outgrow memory, but every aggregate the
+pages draw from it is a sum, a count-weighted mean or a top-n. For exports
+above ``STREAM_BYTES`` those are computed by reading the file in chunks of
+``CHUNK_ROWS`` rows and folding each chunk into running totals, so memory
+is bounded by the size of the result rather than of the file.
+"""
+
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .prepare import LOAD_COLUMNS, PREPARERS, TEXT_COLUMNS, TIME_COLUMNS
+from .sources import source_path
+from .store import has_table
+from .window import in_window
+
+STREAM_BYTES = 256 << 20
+CHUNK_ROWS = 100_000
+
+# One post per row, so any split into chunks is valid
+STREAMABLE = ["facebook", "meta_suite"]
+
+
+def is_streamed(name, data_dir="."):
+    """Whether ``name`` is aggregated in chunks instead of loaded whole."""
+    if name not in STREAMABLE or has_table(name, data_dir):
+        # Ingested sources are already split by month in the store
+        return False
+    path = source_path(name, data_dir)
+    return path.exists() and path.stat().st_size > STREAM_BYTES
+
+
+def _excel_chunks(path, columns, chunk_rows):
+    # openpyxl's read-only mode streams rows instead of building the sheet.
+    # Only exports this large need it, so it is not imported at startup.
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell) for cell in next(rows)]
+        start = 0
+        while True:
+            batch = list(islice(rows, chunk_rows))
+            if not batch and start:
+                return
+            # Row labels run on across chunks, like read_csv's
+            index = pd.RangeIndex(start, start + len(batch))
+            chunk = pd.DataFrame(batch, columns=header, index=index)
+            start += len(batch)
+            yield chunk if columns is None else chunk[columns]
+            if not batch:
+                # A sheet without rows is one empty chunk
+                return
+    finally:
+        workbook.close()
+
+
+def iter_chunks(name, data_dir=".", columns=None, chunk_rows=CHUNK_ROWS):
+    """Raw export rows of ``name`` in chunks, limited to ``columns``.
+
+    An export without rows is one empty chunk, as ``read_csv`` gives.
+    """
+    path = Path(source_path(name, data_dir))
+    if path.suffix == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+    else:
+        yield from _excel_chunks(path, columns, chunk_rows)
+
+
+def iter_prepared(name, data_dir=".", text=False, chunk_rows=CHUNK_ROWS, window=None):
+    """Prepared chunks of ``name``, with its free text when ``text`` is set.
+
+    With a date ``window``, each chunk is limited to the rows within it.
+    """
+    columns = LOAD_COLUMNS.get(name)
+    if columns is not None and text:
+        columns = columns + TEXT_COLUMNS[name]
+    for chunk in iter_chunks(name, data_dir, columns, chunk_rows):
+        chunk = PREPARERS[name](chunk)
+        if window is not None:
+            chunk = chunk[in_window(chunk, TIME_COLUMNS[name], window)]
+        yield chunk
+
+
+def top_rows(chunks, by, n, columns):
+    """``columns`` of the ``n`` rows with the largest ``by`` over all chunks."""
+    top = pd.DataFrame(columns=columns)
+    for i, chunk in enumerate(chunks):
+        best = chunk.nlargest(n, by)[columns]
+        top = best if i == 0 else pd.concat([top, best]).nlargest(n, by)
+    return top
+
+
+def theme_stats(name, data_dir, tagger, text_column, metrics, window=None):
+    """``ThemeTagger.stats`` over the chunks of ``name``."""
+    sums = np.zeros((len(tagger.themes), len(metrics)))
+    counts = np.zeros_like(sums)
+    posts = np.zeros(len(tagger.themes), dtype=int)
+    for chunk in iter_prepared(name, data_dir, text=True, window=window):
+        chunk_sums, chunk_counts, chunk_posts = tagger.totals(
+            chunk[text_column].fillna(""), chunk[metrics]
+        )
+        sums = sums + chunk_sums
+        counts = counts + chunk_counts
+        posts = posts + chunk_posts
+    return tagger.means(sums, counts, posts, metrics)
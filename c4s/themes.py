@@ -0,0 +1,85 @@
+"""Keyword theme tagging for post descriptions, titles and campaign names."""
+
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Sparse post x theme indicator: parallel arrays of (post, theme) positions
+ThemeTags = namedtuple("ThemeTags", ["post", "theme", "n_posts"])
+
+
+class ThemeTagger:
+    """Match every keyword against a text column in a single pass.
+
+    A post carries a theme when the keyword occurs anywhere in its
+    lowercased text, the same rule as ``str.contains(keyword)``.
+    """
+
+    def __init__(self, keywords):
+        self.themes = list(dict.fromkeys(kw.lower() for kw in keywords))
+        # A zero-width lookahead tries the alternation at every offset, so
+        # overlapping keywords are all found; longest first per offset
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(self.themes, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))")
+        # A match on "events" also means "event" occurs at that offset
+        self._implied = {
+            kw: [i for i, other in enumerate(self.themes) if kw.startswith(other)]
+            for kw in self.themes
+        }
+
+    def tag(self, texts):
+        texts = pd.Series(texts).reset_index(drop=True)
+        lowered = texts.fillna("").astype(str).str.lower()
+        hits = lowered.str.findall(self._pattern).explode().dropna()
+        if hits.empty:
+            empty = np.array([], dtype=np.intp)
+            return ThemeTags(empty, empty, len(texts))
+        themes = hits.map(self._implied).explode()
+        pairs = np.unique(
+            themes.index.to_numpy(dtype=np.intp) * len(self.themes)
+            + themes.to_numpy(dtype=np.intp)
+        )
+        post, theme = np.divmod(pairs, len(self.themes))
+        return ThemeTags(post, theme, len(texts))
+
+    def indicator(self, texts):
+        """Dense 0/1 post x theme frame, for display or export."""
+        tags = self.tag(texts)
+        dense = np.zeros((tags.n_posts, len(self.themes)), dtype=np.int8)
+        dense[tags.post, tags.theme] = 1
+        return pd.DataFrame(dense, columns=self.themes)
+
+    def totals(self, texts, metrics):
+        """Per-theme metric sums, non-missing counts and post counts.
+
+        Computed as indicator^T @ metrics on the sparse pairs. Totals of
+        separate chunks of posts add up to the totals of all of them.
+        """
+        tags = self.tag(texts)
+        values = metrics.to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        sums = np.zeros((len(self.themes), values.shape[1]))
+        counts = np.zeros_like(sums)
+        np.add.at(sums, tags.theme, np.where(present, values, 0.0)[tags.post])
+        np.add.at(counts, tags.theme, present[tags.post])
+        posts = np.bincount(tags.theme, minlength=len(self.themes))
+        return sums, counts, posts
+
+    def means(self, sums, counts, posts, columns):
+        """Per-theme means from ``totals``; themes with no posts are left out."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        result = pd.DataFrame(means, columns=columns)
+        result.insert(0, "theme", self.themes)
+        return result[posts > 0].reset_index(drop=True)
+
+    def stats(self, texts, metrics):
+        """Mean of each metric over the posts carrying each theme.
+
+        Missing values are skipped like ``groupby().mean()`` does.
+        """
+        return self.means(*self.totals(texts, metrics), metrics.columns)
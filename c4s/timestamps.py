@@ -0,0 +1,72 @@
+"""Timestamp parsing with each export's known format.
+
+Parsing with an explicit format is vectorized, where format inference falls
+back to dateutil row by row. Only the rows that do not match the format are
+parsed individually, and rows that still fail are reported with an
+``UnparsedTimestamps`` warning and counted in the frame's ``attrs``.
+
+Exports carry no UTC offset. LinkedIn writes UTC; Meta and the email
+platform write the account's local time, which is taken to be UTC unless
+``EXPORT_TIMEZONES`` says otherwise. Parsed columns hold naive UTC times.
+"""
+
+import warnings
+
+import pandas as pd
+
+# Source -> strptime format of its timestamp column
+TIMESTAMP_FORMATS = {
+    "email_clicks": "%Y/%m/%d %I:%M %p",
+    "meta_suite": "%m/%d/%Y %H:%M",
+    "facebook": "%m/%d/%Y %H:%M",
+    "linkedin_followers": "%m/%d/%Y",
+    "linkedin_visitors": "%m/%d/%Y",
+    "linkedin_activity": "%m/%d/%Y",
+}
+
+# Source -> IANA time zone of its wall times, when not UTC
+EXPORT_TIMEZONES = {}
+
+UNPARSED = "unparsed_timestamps"
+
+
+class UnparsedTimestamps(UserWarning):
+    pass
+
+
+def parse_timestamps(values, fmt, tz="UTC"):
+    """Naive UTC times of ``values`` and the values that did not parse."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Excel cells arrive as datetimes already
+        parsed = values
+    else:
+        parsed = pd.to_datetime(values, format=fmt, errors="coerce")
+        outliers = parsed.isna() & values.notna()
+        if outliers.any():
+            parsed = parsed.copy()
+            parsed[outliers] = pd.to_datetime(
+                values[outliers], format="mixed", errors="coerce"
+            )
+    if parsed.dt.tz is None and tz != "UTC":
+        parsed = parsed.dt.tz_localize(tz, ambiguous="NaT", nonexistent="NaT")
+    if parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_convert("UTC").dt.tz_localize(None)
+    return parsed, values[parsed.isna() & values.notna()]
+
+
+def normalize_timestamps(df, name, column):
+    """Parse ``df[column]`` of source ``name`` in place."""
+    parsed, unparsed = parse_timestamps(
+        df[column], TIMESTAMP_FORMATS[name], EXPORT_TIMEZONES.get(name, "UTC")
+    )
+    df[column] = parsed
+    if len(unparsed):
+        df.attrs.setdefault(UNPARSED, {})[column] = len(unparsed)
+        examples = ", ".join(repr(value) for value in unparsed.head(3))
+        warnings.warn(
+            f"{name}: {len(unparsed)} {column!r} values are not timestamps "
+            f"(e.g. {examples}); they are left empty",
+            UnparsedTimestamps,
+            stacklevel=2,
+        )
+    return df
@@ -0,0 +1,143 @@
+"""Timing spans for one dashboard rerun, written as JSON lines.
+
+    C4S_TRACE_LOG=traces.jsonl streamlit run app.py
+    python -m c4s.trace traces.jsonl
+
+A ``Trace`` covers one rerun of one section. While it is active, ``span``
+records the wall time of a stage (load, preprocess, aggregate, charts,
+render) together with row counts and payload sizes; code running outside a
+trace, such as ``python -m c4s.report``, pays nothing. Spans nest: a lazy
+load triggered by an aggregate is timed both on its own and as part of it.
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+
+LOG_ENV = "C4S_TRACE_LOG"
+
+_active = contextvars.ContextVar("c4s_trace", default=None)
+_log_lock = threading.Lock()
+
+
+class Trace:
+    """Spans recorded during one rerun of ``section``.
+
+    Used as a context manager, the trace is active for the ``with`` block
+    only, even when the block raises, and ``record`` holds the finished
+    trace afterwards.
+    """
+
+    def __init__(self, section, payloads=False):
+        self.section = section
+        # Payload sizes cost an extra serialization, so they are opt-in
+        self.payloads = payloads
+        self.spans = []
+        self._token = None
+        self._started = None
+        self.record = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.record = self.finish()
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._token = _active.set(self)
+        return self
+
+    def finish(self):
+        if self._token is not None:
+            _active.reset(self._token)
+            self._token = None
+        return {
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "section": self.section,
+            "total_ms": 1000 * (time.perf_counter() - self._started),
+            "spans": self.spans,
+        }
+
+    @contextmanager
+    def span(self, stage, target=None):
+        fields = {"stage": stage, "target": target}
+        started = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            fields["ms"] = 1000 * (time.perf_counter() - started)
+            self.spans.append(fields)
+
+
+def active():
+    return _active.get()
+
+
+@contextmanager
+def span(stage, target=None):
+    """Time a stage on the active trace; yields a dict for extra fields."""
+    trace = _active.get()
+    if trace is None:
+        yield {}
+        return
+    with trace.span(stage, target) as fields:
+        yield fields
+
+
+def log_path():
+    return os.environ.get(LOG_ENV) or None
+
+
+def write(record, path=None):
+    """Append one finished trace to the JSON-lines log, if one is configured."""
+    path = path or log_path()
+    if path is None:
+        return
+    line = json.dumps(record, default=str)
+    with _log_lock, open(path, "a") as fh:
+        fh.write(line + "\n")
+
+
+def summarize(path):
+    """p50/p95 milliseconds per section and stage from a trace log."""
+    records = pd.read_json(path, lines=True)
+    totals = records[["section", "total_ms"]].assign(stage="rerun")
+    spans = records[["section", "spans"]].explode("spans").dropna()
+    # A stage may have several spans per rerun (one per source or chart)
+    stages = (
+        pd.DataFrame(
+            {
+                "rerun": spans.index,
+                "section": spans["section"].to_numpy(),
+                "stage": [entry["stage"] for entry in spans["spans"]],
+                "total_ms": [entry["ms"] for entry in spans["spans"]],
+            }
+        )
+        .groupby(["rerun", "section", "stage"], as_index=False)["total_ms"]
+        .sum()
+    )
+    return (
+        pd.concat([totals, stages.drop(columns="rerun")])
+        .groupby(["section", "stage"])["total_ms"]
+        .describe(percentiles=[0.5, 0.95])[["count", "50%", "95%"]]
+        .rename(columns={"50%": "p50_ms", "95%": "p95_ms"})
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a dashboard trace log.")
+    parser.add_argument("log")
+    args = parser.parse_args(argv)
+    print(summarize(args.log).round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
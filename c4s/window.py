@@ -0,0 +1,59 @@
+"""Date windows over time-sorted frames.
+
+A window is a ``(first_day, last_day)`` pair of dates, both included, or
+``None`` for all rows. Frames are sorted by time once per version, with rows
+that have no time last, so the rows of any window are one contiguous slice
+found by binary search instead of a boolean mask over the whole frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def bounds(window):
+    """Half-open ``[start, stop)`` timestamps covering ``window``."""
+    first, last = window
+    return (
+        pd.Timestamp(first).normalize(),
+        pd.Timestamp(last).normalize() + pd.Timedelta(days=1),
+    )
+
+
+def sort_by_time(frame, column):
+    return frame.sort_values(column, kind="stable", na_position="last")
+
+
+def _times(frame, column):
+    # datetime64 values without a copy; NumPy sorts NaT after every time,
+    # the same order as na_position="last"
+    return frame[column].to_numpy()
+
+
+def positions(frame, column, window):
+    """``(start, stop)`` row positions of ``window`` in time-sorted ``frame``."""
+    times = _times(frame, column)
+    start, stop = bounds(window)
+    return tuple(np.searchsorted(times, [start.to_datetime64(), stop.to_datetime64()]))
+
+
+def time_slice(frame, column, window):
+    """Rows of time-sorted ``frame`` within ``window``."""
+    if window is None:
+        return frame
+    start, stop = positions(frame, column, window)
+    return frame.iloc[start:stop]
+
+
+def time_span(frame, column):
+    """First and last time in time-sorted ``frame``, or ``None`` if it has none."""
+    times = _times(frame, column)
+    valid = np.searchsorted(times, np.datetime64("NaT"))
+    if valid == 0:
+        return None
+    return pd.Timestamp(times[0]), pd.Timestamp(times[valid - 1])
+
+
+def in_window(frame, column, window):
+    """Boolean mask of ``window``, for chunks that are not sorted by time."""
+    start, stop = bounds(window)
+    return (frame[column] >= start) & (frame[column] < stop)
@@ -0,0 +1,44 @@
+"""Word-cloud images rendered once per distinct input text.
+
+wordcloud and matplotlib take most of a second to import, so they are only
+imported by the first render rather than by every page that imports this
+module.
+"""
+
+import io
+
+from .cache import LRUCache, content_key
+
+_PNG_CACHE = LRUCache(maxsize=32)
+
+
+def _render_png(text, width, height, background_color, colormap, figsize, dpi):
+    from matplotlib.figure import Figure
+    from wordcloud import WordCloud
+
+    cloud = WordCloud(
+        width=width, height=height, background_color=background_color, colormap=colormap
+    ).generate(text)
+    # A standalone Figure keeps pyplot's global state out of concurrent sessions
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    ax.imshow(cloud, interpolation="bilinear")
+    ax.axis("off")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def wordcloud_png(
+    text,
+    width=800,
+    height=300,
+    background_color="white",
+    colormap="Blues",
+    figsize=(10, 4),
+    dpi=200,
+):
+    """PNG bytes of the word cloud for ``text``, cached by content and params."""
+    params = (width, height, background_color, colormap, tuple(figsize), dpi)
+    key = content_key(text, params)
+    return _PNG_CACHE.get_or_create(key, lambda: _render_png(text, *params))